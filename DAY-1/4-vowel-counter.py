@@ -1,12 +1,12 @@
 #Vowel Calculator 
 #Vowel counter in string
 
-#input of string and vowel count init 0
+from char_classes import count_classes #character-class counter (char_classes.py)
+
+#input of string
 string = str(input("Enter the Word: "))
-count = 0
 
-for char in string:
-    if char in "aeiouAEIOU":
-        count +=1
+#all vowels counted at once from a byte histogram (no loop over characters)
+count = count_classes(string)["vowels"]
 
 print("Number of Vowels in the string:"+ string +" is : ",count)
\ No newline at end of file
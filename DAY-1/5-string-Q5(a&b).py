@@ -1,6 +1,8 @@
 #Q5a String Reverser : String reverser
 #Q5b Palindrome Checker : Palindrome checker
 
+from palindrome import is_palindrome #palindrome module (palindrome.py)
+
 #input string
 string = str(input("Enter the string : "))
 
@@ -9,8 +11,8 @@ reversed_string = string[::-1]
 print("Reversed String is : ",reversed_string)
 
 #check whether palindrome or not - Q5b
-#Case insensative version
-if string.lower() == reversed_string.lower() :
+#Case insensative version (compares from both ends, no lowered copies)
+if is_palindrome(string, ignore_case=True) :
     print(string + " is palindrome")
 else:
     print(string + " is not a palindrome")
\ No newline at end of file
@@ -1,8 +1,26 @@
 #Q6a Min-Max finder
 #Q6b Sum of all elements in the list
 
+import sys
+
+from number_parser import read_numbers #shared input parser (number_parser.py)
+from running_stats import stats_from_text #one-pass statistics (running_stats.py)
+
+#a file name (or "-" for stdin) can be given as argument: python "6-Lists-Q6(a&b).py" numbers.txt
+#huge inputs are streamed in chunks and never stored as one list
+if len(sys.argv) > 1:
+    stats = stats_from_text(sys.argv[1])
+    print("Count:", stats.count)
+    print("Min:", stats.min)
+    print("Max:", stats.max)
+    print("Sum:", stats.sum)
+    print("Mean:", stats.mean)
+    print("Variance:", stats.variance)
+    sys.exit()
+
 #input List 
-nums = list(map(int , input("Enter the list : ").split(",")))
+#works for every input type: 1,2,3 / 1 2 3 / [1, 2, 3] / (1,2,3) / {1 2 3}
+nums = read_numbers()
 
 #Q6a To find Min-Max
 print("Numbers:", nums)
@@ -11,27 +29,3 @@ print("Max:", max(nums))
 
 #Q6b To find the sum of elements 
 print("Sum:", sum(nums))
-
-
-'''
-WORKING FOR EVERY INPUT TYPE
-
-raw = input("Enter numbers: ")
-
-# remove brackets and spaces
-clean = raw.strip().replace('(', '').replace(')', '') \
-                  .replace('[', '').replace(']', '') \
-                  .replace('{', '').replace('}', '')
-
-# split by comma or space
-if ',' in clean:
-    nums = list(map(int, clean.split(',')))
-else:
-    nums = list(map(int, clean.split()))
-
-print("Numbers:", nums)
-print("Min:", min(nums))
-print("Max:", max(nums))
-print("Sum:", sum(nums))
-
-'''
\ No newline at end of file
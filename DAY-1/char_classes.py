@@ -0,0 +1,137 @@
+#Q4 Vowel counter
+#Module : character-class counting with one np.bincount per block of bytes
+
+import time
+
+import numpy as np
+
+#bytes read per block when streaming a file
+BLOCK_SIZE = 1 << 23
+
+VOWELS = "aeiouAEIOU"
+LETTERS = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+DIGITS = "0123456789"
+
+_VOWEL_BYTES = np.frombuffer(VOWELS.encode(), dtype=np.uint8)
+_CONSONANT_BYTES = np.frombuffer(bytes(c for c in LETTERS.encode() if chr(c) not in VOWELS), dtype=np.uint8)
+_DIGIT_BYTES = np.frombuffer(DIGITS.encode(), dtype=np.uint8)
+#UTF-8 continuation bytes (10xxxxxx) do not start a new character
+_CONTINUATION_BYTES = np.arange(0x80, 0xC0)
+
+
+class CharClassCounter:
+    """
+    Counts vowels, consonants, digits and other characters of UTF-8 text.
+    Each block is turned into a 256-bin byte histogram with np.bincount,
+    so the cost per character is a single C-level increment.
+    Vowels and consonants are the ASCII letters; everything else,
+    including non-ASCII letters, counts as other.
+    """
+
+    def __init__(self):
+        self.histogram = np.zeros(256, dtype=np.int64)
+
+    def update(self, data):
+        """
+        Add a block of text (str is encoded as UTF-8, bytes are used as they are).
+        """
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        if data:
+            self.histogram += np.bincount(np.frombuffer(data, dtype=np.uint8), minlength=256)
+        return self
+
+    def _present(self, byte_values):
+        return "".join(chr(b) for b in byte_values if self.histogram[b])
+
+    def result(self):
+        """
+        Return a dict with the vowel, consonant, digit and other counts,
+        plus the distinct vowels, consonants and digits that were seen.
+        """
+        h = self.histogram
+        vowels = int(h[_VOWEL_BYTES].sum())
+        consonants = int(h[_CONSONANT_BYTES].sum())
+        digits = int(h[_DIGIT_BYTES].sum())
+        characters = int(h.sum() - h[_CONTINUATION_BYTES].sum())
+        return {
+            "vowels": vowels,
+            "consonants": consonants,
+            "digits": digits,
+            "other": characters - vowels - consonants - digits,
+            "distinct_vowels": self._present(_VOWEL_BYTES),
+            "distinct_consonants": self._present(_CONSONANT_BYTES),
+            "distinct_digits": self._present(_DIGIT_BYTES),
+        }
+
+
+def count_classes(text):
+    """
+    Return the character-class counts (see CharClassCounter.result) of a str or bytes.
+    """
+    return CharClassCounter().update(text).result()
+
+
+def count_file(path, block_size=BLOCK_SIZE):
+    """
+    Return the character-class counts of a file, read in binary blocks
+    so multi-GB logs never have to fit in memory.
+    """
+    counter = CharClassCounter()
+    with open(path, "rb") as f:
+        while True:
+            block = f.read(block_size)
+            if not block:
+                break
+            counter.update(block)
+    return counter.result()
+
+
+def _count_vowels_loop(string):
+    #original approach from DAY-1/4-vowel-counter.py
+    count = 0
+    for char in string:
+        if char in "aeiouAEIOU":
+            count += 1
+    return count
+
+
+def _vowels_consonants_loop(text):
+    #original approach from DAY-4/4-count-vowels-consonants.py
+    vowels = []
+    consonants = []
+    for i in text:
+        if i.isalpha():
+            if i in "aeiouAEIOU":
+                if i not in vowels:
+                    vowels.append(i)
+            else:
+                if i not in consonants:
+                    consonants.append(i)
+    return vowels, consonants
+
+
+def benchmark(size=10_000_000):
+    #character loops vs one bincount
+    rng = np.random.default_rng(0)
+    alphabet = np.frombuffer(b"abcdefghijklmnopqrstuvwxyzABCDEFGHIJ0123456789 .,\n", dtype=np.uint8)
+    text = rng.choice(alphabet, size=size).tobytes().decode()
+
+    start = time.perf_counter()
+    vowels = _count_vowels_loop(text)
+    distinct_v, distinct_c = _vowels_consonants_loop(text)
+    t_loop = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = count_classes(text)
+    t_count = time.perf_counter() - start
+
+    assert result["vowels"] == vowels
+    assert sorted(result["distinct_vowels"]) == sorted(distinct_v)
+    assert sorted(result["distinct_consonants"]) == sorted(distinct_c)
+    mb = size / 2**20
+    print(f"{mb:.0f} MB: character loops {mb / t_loop:.1f} MB/s, bincount {mb / t_count:.1f} MB/s")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,137 @@
+#Q6 List input parser
+#Module : one-pass parser for numbers written as "1,2,3", "[1, 2, 3]", "(1 2 3)", ...
+#Used by 6-Lists-Q6(a&b).py and running_stats.py
+
+import io
+import os
+import re
+import sys
+import time
+
+import numpy as np
+
+#characters read per chunk when streaming a file or stdin
+CHUNK_CHARS = 1 << 20
+
+#only used by the benchmark (regex findall as an alternative parser)
+INT_PATTERN = re.compile(r"[-+]?\d+")
+
+#brackets, parentheses, braces and commas all become spaces (one translate pass)
+_SEPARATORS = str.maketrans({c: " " for c in "[](){},;"})
+
+
+def parse_numbers(text, dtype=int):
+    """
+    Return the list of numbers found in text, whatever the separators:
+    commas, whitespace, brackets, parentheses or braces.
+    dtype=int reads integers, dtype=float also reads decimals and exponents.
+    One str.translate pass + split; a token that is not a number ("1.5" for
+    int, "1-2", "abc") raises ValueError, like parse_array.
+    """
+    try:
+        return list(map(dtype, text.translate(_SEPARATORS).split()))
+    except ValueError:
+        raise ValueError("input contains something that is not a number") from None
+
+
+def parse_array(text, dtype=np.int64):
+    """
+    Same as parse_numbers but returns a NumPy array, converted in bulk by
+    np.fromstring after one str.translate pass over the separators.
+    """
+    clean = text.translate(_SEPARATORS)
+    if not clean.strip():
+        return np.empty(0, dtype=dtype)
+    try:
+        return np.fromstring(clean, dtype=dtype, sep=" ")
+    except ValueError:
+        raise ValueError("input contains something that is not a number") from None
+
+
+def _open_source(source):
+    #"-" -> stdin, path -> opened file (a missing path raises FileNotFoundError), file object -> as it is
+    if source == "-":
+        return sys.stdin, False
+    if isinstance(source, (str, bytes, os.PathLike)):
+        return open(source, encoding="utf-8"), True
+    return source, False
+
+
+def iter_chunks(source, dtype=np.int64, chunk_chars=CHUNK_CHARS):
+    """
+    Yield NumPy arrays of the numbers in source, one array per chunk read.
+    source: "-" for stdin, a file path or an open text file
+    (wrap inline text in io.StringIO).
+    A number cut in two at the end of a chunk is carried over to the next one,
+    so even a single giant line is never held in memory at once.
+    """
+    f, should_close = _open_source(source)
+    carry = ""
+    try:
+        while True:
+            block = f.read(chunk_chars)
+            if not block:
+                break
+            block = carry + block.translate(_SEPARATORS)
+            #keep the (possibly unfinished) last token for the next chunk
+            cut = max(block.rfind(" "), block.rfind("\n"), block.rfind("\t"))
+            carry = block[cut + 1:]
+            if cut >= 0:
+                yield parse_array(block[:cut + 1], dtype)
+        if carry.strip():
+            yield parse_array(carry, dtype)
+    finally:
+        if should_close:
+            f.close()
+
+
+def iter_numbers(source, dtype=int, chunk_chars=CHUNK_CHARS):
+    """
+    Yield the numbers of source one by one as Python ints/floats, streaming in chunks.
+    """
+    np_dtype = np.int64 if dtype is int else np.float64
+    for chunk in iter_chunks(source, np_dtype, chunk_chars):
+        yield from chunk.tolist()
+
+
+def read_numbers(source=None, dtype=int, prompt="Enter the list : "):
+    """
+    Return the list of numbers from source (see iter_chunks), or from one
+    input() line if source is None.
+    """
+    if source is None:
+        return parse_numbers(input(prompt), dtype)
+    return list(iter_numbers(source, dtype))
+
+
+def _parse_with_replace(raw):
+    #the commented "works for every input type" parser from 6-Lists-Q6(a&b).py
+    clean = raw.strip().replace('(', '').replace(')', '') \
+                      .replace('[', '').replace(']', '') \
+                      .replace('{', '').replace('}', '')
+    if ',' in clean:
+        return list(map(int, clean.split(',')))
+    return list(map(int, clean.split()))
+
+
+def benchmark(n=1_000_000):
+    #six replace() calls + split vs regex vs NumPy bulk conversion vs chunked stream
+    numbers = np.random.default_rng(0).integers(-10**9, 10**9, size=n)
+    text = "[" + ", ".join(map(str, numbers.tolist())) + "]"
+    expected = numbers.tolist()
+
+    cases = [("replace + split", lambda: _parse_with_replace(text)),
+             ("translate + split", lambda: parse_numbers(text)),
+             ("regex findall", lambda: list(map(int, INT_PATTERN.findall(text)))),
+             ("np.fromstring", lambda: parse_array(text).tolist()),
+             ("chunked stream", lambda: list(iter_numbers(io.StringIO(text), chunk_chars=1 << 16)))]
+    for name, run in cases:
+        start = time.perf_counter()
+        result = run()
+        elapsed = time.perf_counter() - start
+        assert result == expected, name
+        print(f"{name:>17}: {elapsed:.3f} s ({n / elapsed:,.0f} numbers/s)")
+
+
+if __name__ == "__main__":
+    benchmark()
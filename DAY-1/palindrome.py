@@ -0,0 +1,150 @@
+#Q5b Palindrome Checker
+#Module : palindrome checks without building reversed / lowered copies of the input
+#Used by 5-string-Q5(a&b).py
+
+import re
+import time
+
+#characters compared per step by the block comparison
+BLOCK = 4096
+
+#everything that is not a letter or digit (underscore included)
+_NON_ALNUM = re.compile(r"[\W_]+")
+
+
+def _is_palindrome_blocks(s, ignore_case):
+    #compare a block from the front with the mirrored block from the back;
+    #only BLOCK characters are copied at a time and a mismatch stops early
+    i, j = 0, len(s)
+    while j - i > 1:
+        size = min(BLOCK, (j - i) // 2)
+        front = s[i:i + size]
+        back = s[j - size:j][::-1]
+        if ignore_case:
+            front, back = front.lower(), back.lower()
+        if front != back:
+            return False
+        i += size
+        j -= size
+    return True
+
+
+def _is_palindrome_alnum(s, ignore_case):
+    #cleaned blocks from both ends; characters not yet matched wait in front/back
+    def clean(block):
+        block = _NON_ALNUM.sub("", block)
+        return block.lower() if ignore_case else block
+
+    front = back = "" #back holds the cleaned end of s already reversed
+    i, j = 0, len(s)
+    while i < j:
+        size = min(BLOCK, j - i)
+        if len(front) <= len(back):
+            front += clean(s[i:i + size])
+            i += size
+        else:
+            back += clean(s[j - size:j])[::-1]
+            j -= size
+        k = min(len(front), len(back))
+        if front[:k] != back[:k]:
+            return False
+        front, back = front[k:], back[k:]
+    #what is left is the (short) middle part, it must mirror itself
+    rest = front or back
+    return rest == rest[::-1]
+
+
+def is_palindrome(s, ignore_case=True, alnum_only=False):
+    """
+    Return True if s reads the same forwards and backwards.
+    ignore_case: "Level" counts as a palindrome.
+    alnum_only: skip spaces and punctuation ("A man, a plan, a canal: Panama").
+    Compares from both ends and stops at the first mismatch; no full reversed,
+    lowered or cleaned copy of s is made.
+    """
+    if alnum_only:
+        return _is_palindrome_alnum(s, ignore_case)
+    return _is_palindrome_blocks(s, ignore_case)
+
+
+def check_file(path, ignore_case=True, alnum_only=False):
+    """
+    Yield (line_number, line, is_palindrome) for every line of a text file,
+    reading one line at a time.
+    """
+    with open(path, encoding="utf-8") as f:
+        for number, line in enumerate(f, start=1):
+            line = line.rstrip("\r\n")
+            yield number, line, is_palindrome(line, ignore_case, alnum_only)
+
+
+def longest_palindromic_substring(s):
+    """
+    Return the longest palindromic substring of s (the first one if several tie).
+    Manacher's algorithm, O(n) time.
+    """
+    if not s:
+        return ""
+    #radius[i] = palindrome radius around position i of "#a#b#c#" (without building it)
+    n = 2 * len(s) + 1
+    radius = [0] * n
+    center = right = 0
+    best_len = best_center = 0
+    for i in range(n):
+        if i < right:
+            radius[i] = min(right - i, radius[2 * center - i])
+        #expand; even i are separators, odd i are characters s[i // 2]
+        a, b = i - radius[i] - 1, i + radius[i] + 1
+        while a >= 0 and b < n and (a % 2 == 0 or s[a // 2] == s[b // 2]):
+            radius[i] += 1
+            a -= 1
+            b += 1
+        if i + radius[i] > right:
+            center, right = i, i + radius[i]
+        if radius[i] > best_len:
+            best_len, best_center = radius[i], i
+    start = (best_center - best_len) // 2
+    return s[start:start + best_len]
+
+
+def _is_palindrome_copies(s):
+    #original approach: cleaned, lowered and reversed copies of the whole string
+    clean = "".join(c for c in s if c.isalnum()).lower()
+    return clean == clean[::-1]
+
+
+def benchmark(size=10_000_000):
+    #full copies vs comparing from both ends (palindrome and early mismatch)
+    half = "abcde" * (size // 10)
+    palindrome = half + half[::-1]
+    mismatch = "x" + palindrome[1:]
+    for name, text in (("palindrome", palindrome), ("mismatch at start", mismatch)):
+        start = time.perf_counter()
+        expected = text.lower() == text[::-1].lower()
+        t_copy = time.perf_counter() - start
+        start = time.perf_counter()
+        result = is_palindrome(text)
+        t_new = time.perf_counter() - start
+        assert result == expected
+        print(f"{name}, {len(text)} chars: copies {t_copy:.4f} s, from both ends {t_new:.4f} s")
+
+    base = "A man, a plan, a canal: Panama! " * 20_000
+    sentence = base + base[::-1]
+    start = time.perf_counter()
+    expected = _is_palindrome_copies(sentence)
+    t_copy = time.perf_counter() - start
+    start = time.perf_counter()
+    result = is_palindrome(sentence, alnum_only=True)
+    t_new = time.perf_counter() - start
+    assert result == expected
+    print(f"alnum only, {len(sentence)} chars: cleaned copy {t_copy:.4f} s, cleaned blocks from both ends {t_new:.4f} s")
+
+    text = "ab" * 50_000 + "racecar" + "cd" * 50_000
+    start = time.perf_counter()
+    longest = longest_palindromic_substring(text)
+    print(f"Manacher on {len(text)} chars: {longest[:20]!r}... ({len(longest)} chars) "
+          f"in {time.perf_counter() - start:.3f} s")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,196 @@
+#Q6 Min-Max / Sum of a list
+#Module : one-pass streaming statistics (count, min, max, sum, mean, variance)
+
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from number_parser import iter_chunks #shared input parser (number_parser.py)
+
+#items read per chunk from a binary file
+CHUNK_ITEMS = 1 << 20
+
+
+class RunningStats:
+    """
+    One-pass accumulator: count, min, max, sum, mean and variance.
+    Values are consumed one by one (add), from any iterable (update)
+    or as NumPy chunks (update_array), so nothing has to be kept in memory.
+    Variance uses Welford's method; two accumulators can be merged,
+    e.g. the partial results of parallel workers.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self.sum = 0
+        self.mean = 0.0
+        self._m2 = 0.0 #sum of squared differences from the mean
+
+    def __repr__(self):
+        return (f"RunningStats(count={self.count}, min={self.min}, max={self.max}, "
+                f"sum={self.sum}, mean={self.mean}, variance={self.variance})")
+
+    def add(self, x):
+        """
+        Add one value (Welford's update).
+        """
+        self.count += 1
+        self.sum += x
+        if x < self.min:
+            self.min = x
+        if x > self.max:
+            self.max = x
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (x - self.mean)
+        return self
+
+    def update(self, iterable):
+        """
+        Add every value of an iterable (generator, file of numbers, ...).
+        """
+        for x in iterable:
+            self.add(x)
+        return self
+
+    def update_array(self, arr):
+        """
+        Add a NumPy chunk: its statistics are computed vectorised and merged in.
+        """
+        arr = np.asarray(arr).ravel()
+        if arr.size == 0:
+            return self
+        chunk = RunningStats()
+        chunk.count = int(arr.size)
+        chunk.min = arr.min().item()
+        chunk.max = arr.max().item()
+        if arr.dtype.kind in "iu":
+            #int64 sum when it cannot overflow, exact Python ints otherwise
+            bound = max(abs(int(chunk.min)), abs(int(chunk.max))) * chunk.count
+            chunk.sum = int(arr.sum(dtype=np.int64)) if bound < 2**63 else int(arr.sum(dtype=object))
+        else:
+            chunk.sum = arr.sum().item()
+        chunk.mean = chunk.sum / chunk.count
+        chunk._m2 = float(((arr - chunk.mean) ** 2).sum())
+        return self.merge(chunk)
+
+    def merge(self, other):
+        """
+        Combine another accumulator into this one (Chan et al. parallel formula).
+        """
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.__dict__.update(other.__dict__)
+            return self
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self._m2 += other._m2 + delta * delta * self.count * other.count / total
+        self.mean += delta * other.count / total
+        self.count = total
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    @property
+    def variance(self):
+        """
+        Population variance (divide by n); nan when empty.
+        """
+        return self._m2 / self.count if self.count else math.nan
+
+    @property
+    def sample_variance(self):
+        """
+        Sample variance (divide by n - 1); nan with fewer than 2 values.
+        """
+        return self._m2 / (self.count - 1) if self.count > 1 else math.nan
+
+    @property
+    def std(self):
+        return math.sqrt(self.variance)
+
+
+def stats_from_text(source, dtype=np.int64):
+    """
+    Statistics of the numbers in a text source ("-" for stdin, a file path or
+    an open text file; wrap inline text in io.StringIO), streamed chunk by
+    chunk through the shared parser.
+    """
+    stats = RunningStats()
+    for chunk in iter_chunks(source, dtype):
+        stats.update_array(chunk)
+    return stats
+
+
+def _binary_range_stats(args):
+    #statistics of items [start, stop) of a raw binary file, read in chunks
+    path, dtype, start, stop, chunk_items = args
+    data = np.memmap(path, dtype=dtype, mode="r")
+    stats = RunningStats()
+    for low in range(start, stop, chunk_items):
+        stats.update_array(np.array(data[low:min(low + chunk_items, stop)]))
+    return stats
+
+
+def stats_from_binary(path, dtype=np.float64, processes=None, chunk_items=CHUNK_ITEMS):
+    """
+    Statistics of a raw binary file of numbers (as written by ndarray.tofile).
+    With processes > 1 the file is split into equal ranges, one per worker,
+    and the partial accumulators are merged.
+    """
+    total = os.path.getsize(path) // np.dtype(dtype).itemsize
+    if total == 0:
+        return RunningStats()
+    if not processes or processes == 1:
+        return _binary_range_stats((path, dtype, 0, total, chunk_items))
+    step = -(-total // processes)
+    jobs = [(path, dtype, low, min(low + step, total), chunk_items) for low in range(0, total, step)]
+    stats = RunningStats()
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        for partial in pool.map(_binary_range_stats, jobs):
+            stats.merge(partial)
+    return stats
+
+
+def _three_passes(nums):
+    #original approach from 6-Lists-Q6(a&b).py
+    return min(nums), max(nums), sum(nums)
+
+
+def benchmark(n=5_000_000, path="running_stats_bench.bin"):
+    #list + min/max/sum vs streamed chunks (single and multi process)
+    data = np.random.default_rng(0).normal(100, 15, size=n)
+    data.tofile(path)
+    try:
+        start = time.perf_counter()
+        nums = np.fromfile(path).tolist()
+        expected = _three_passes(nums)
+        t_old = time.perf_counter() - start
+        del nums
+
+        start = time.perf_counter()
+        stats = stats_from_binary(path)
+        t_stream = time.perf_counter() - start
+
+        start = time.perf_counter()
+        parallel = stats_from_binary(path, processes=4)
+        t_parallel = time.perf_counter() - start
+
+        assert (stats.min, stats.max) == expected[:2] == (parallel.min, parallel.max)
+        assert math.isclose(stats.sum, expected[2]) and math.isclose(parallel.variance, data.var())
+        print(f"{n} values: list + 3 passes {t_old:.3f} s, chunked stream {t_stream:.3f} s, "
+              f"4 processes {t_parallel:.3f} s")
+        print(parallel)
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -1,5 +1,8 @@
 #13. Reverse each word in a sentence while keeping the word order the same
 
+import re
+
 sentence = "Hello world from Python"
-reversed_words = " ".join(word[::-1] for word in sentence.split())
+#one regex pass, every word reversed where it stands (see DAY-5/word_reverse.py for files)
+reversed_words = re.sub(r"\S+", lambda word: word.group()[::-1], sentence)
 print(reversed_words)  # "olleH dlrow morf nohtyP"
\ No newline at end of file
@@ -1,6 +1,9 @@
 # 3. Sort a dictionary by its values in descending order and print the top 3 items
+import heapq
 
 sample = {"apple": 5, "banana": 12, "cherry": 3, "date": 20, "elderberry": 9}
 
-top3 = sorted(sample.items(), key=lambda kv: kv[1], reverse=True)[:3]
+# heapq.nlargest keeps only 3 items while scanning (O(n log 3)) instead of sorting the whole dict
+# (DAY-2/ranking.py has top_n_items and RankedDict for larger N and frequent updates)
+top3 = heapq.nlargest(3, sample.items(), key=lambda kv: kv[1])
 print("Top 3:", top3)
\ No newline at end of file
@@ -1,11 +1,19 @@
-import re
-
 # Sample string
 s = "A man, a plan, a canal: Panama"
 
-# Remove non-alphanumeric and lowercase
-clean = re.sub(r'[^a-zA-Z0-9]', '', s).lower()
-
-# Check palindrome
-is_palindrome = clean == clean[::-1]
+# Check palindrome from both ends: skip non-alphanumeric characters and
+# lowercase one character at a time (no cleaned, lowered or reversed copy)
+i, j = 0, len(s) - 1
+is_palindrome = True
+while i < j:
+    if not s[i].isalnum():
+        i += 1
+    elif not s[j].isalnum():
+        j -= 1
+    elif s[i].lower() != s[j].lower():
+        is_palindrome = False # first mismatch, stop early
+        break
+    else:
+        i += 1
+        j -= 1
 print("Is palindrome:", is_palindrome)
@@ -1,10 +1,23 @@
 # 2) Check if a number is prime — efficient sqrt(n) check
+#    + deterministic Miller–Rabin for 64-bit numbers and a batch API
 import math
+import random
 
-def is_prime(n: int) -> bool:
+import numpy as np
+
+# small primes used as a quick pre-filter before Miller–Rabin
+SMALL_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47,
+                53, 59, 61, 67, 71, 73, 79, 83, 89, 97)
+
+# these bases make Miller–Rabin exact for every n < 2**64
+MR_BASES_64 = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+
+def is_prime_trial(n: int) -> bool:
     """
     Return True if n is prime, False otherwise.
     Handles n <= 1 as non-prime. Uses trial division up to sqrt(n).
+    Kept as the reference implementation for the cross-check below.
     """
     if n <= 1:
         return False
@@ -19,6 +32,92 @@ def is_prime(n: int) -> bool:
             return False
     return True
 
+
+def _miller_rabin(n: int) -> bool:
+    """
+    Strong probable-prime test of odd n > 37 against MR_BASES_64.
+    Deterministic for n < 2**64; for bigger n it is a 12-base probable-prime test.
+    """
+    # write n - 1 as d * 2**s with d odd
+    d = n - 1
+    s = (d & -d).bit_length() - 1
+    d >>= s
+    for a in MR_BASES_64:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def is_prime(n: int, mode: str = "mr") -> bool:
+    """
+    Return True if n is prime, False otherwise.
+    mode="mr"    -> small-prime filter + deterministic Miller–Rabin (O(log^3 n))
+    mode="trial" -> trial division up to sqrt(n) (O(sqrt n))
+    """
+    if mode == "trial":
+        return is_prime_trial(n)
+    if mode != "mr":
+        raise ValueError(f"unknown mode: {mode!r}")
+    if n < 2:
+        return False
+    # fast path: small numbers and numbers with a small factor
+    for p in SMALL_PRIMES:
+        if n % p == 0:
+            return n == p
+    if n < SMALL_PRIMES[-1] ** 2:
+        return True
+    return _miller_rabin(n)
+
+
+def is_prime_many(values) -> np.ndarray:
+    """
+    Return a boolean NumPy array telling which of the given integers are prime.
+    The small-prime filter runs vectorised over the whole array; only the
+    survivors are checked one by one with Miller–Rabin.
+    """
+    if not isinstance(values, np.ndarray):
+        values = np.asarray(list(values))
+    if values.dtype.kind not in "iu" or (values.dtype.kind == "i" and values.size and values.min() < 0):
+        # negative or > 64-bit values: fall back to the scalar path
+        return np.array([is_prime(int(v)) for v in values.ravel()], dtype=bool)
+    arr = values.astype(np.uint64).ravel()
+
+    result = arr >= 2
+    undecided = result.copy()
+    for p in SMALL_PRIMES:
+        divisible = arr % np.uint64(p) == 0
+        # a multiple of p is prime only if it is p itself
+        result[undecided & divisible] = False
+        result[arr == p] = True
+        undecided &= ~divisible
+    # anything below 97**2 without a small factor is prime
+    undecided &= arr >= np.uint64(SMALL_PRIMES[-1] ** 2)
+
+    for i in np.flatnonzero(undecided):
+        result[i] = _miller_rabin(int(arr[i]))
+    return result
+
+
 # Examples
 for x in [1, 2, 3, 4, 17, 18, 97]:
-    print(x, "is prime?", is_prime(x))
\ No newline at end of file
+    print(x, "is prime?", is_prime(x))
+
+# 64-bit examples (trial division would need billions of divisions here)
+for x in [2**61 - 1, 2**64 - 59, 2**64 - 1, 3215031751]:
+    print(x, "is prime?", is_prime(x))
+
+print("Batch:", is_prime_many([0, 1, 2, 91, 97, 7919, 2**61 - 1, 2**62]))
+
+# Cross-check against the trial-division reference
+check = list(range(20_000)) + [random.randrange(10**9, 10**10) for _ in range(200)]
+batch = is_prime_many(check)
+for i, x in enumerate(check):
+    assert is_prime(x) == is_prime_trial(x) == batch[i], x
+print("Cross-check passed for", len(check), "numbers")
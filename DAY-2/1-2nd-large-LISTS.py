@@ -1,16 +1,17 @@
 #Q1: Find second largest number in list
 
-#Take input of list
-numbers = list(map(int,input("ENTER LIST INPUT: ").split(",")))
+from ranking import second_largest #top-k module (ranking.py)
 
-#Finding max from list 
-max_number = max(numbers)
+#Take input of list (commas, spaces or brackets all work; one translate pass + split,
+#the same way DAY-1/number_parser.py parses lists)
+numbers = list(map(int, input("ENTER LIST INPUT: ").translate(str.maketrans("[](){},", "       ")).split()))
 
-#Loop for finding 2nd largest number in the List
-second_max = -1  #initially assigning second_max as -1 
-for i in numbers:
-    if i>second_max and i != max_number :
-        second_max = i
+#Finding the 2nd largest distinct number in one pass
+#(no max() + rescan, and no -1 seed, so negative numbers work)
+second_max = second_largest(numbers)
 
 #Printing the second largest number from the list 
-print(second_max,"is second largest number from the string :",numbers)
\ No newline at end of file
+if second_max is None:
+    print("No second largest number in the list :",numbers)
+else:
+    print(second_max,"is second largest number from the string :",numbers)
@@ -1,5 +1,9 @@
 #Q10 Convert list of tuples to dictionary
 
+import io
+
+from dict_builder import dict_from_columns #bulk dict module (dict_builder.py)
+
 #sample data
 pairs = [("a", 1), ("b", 2), ("c", 3)]
 
@@ -7,4 +11,8 @@ pairs = [("a", 1), ("b", 2), ("c", 3)]
 my_dict = dict(pairs) 
 
 #printing the result
-print(my_dict)
\ No newline at end of file
+print(my_dict)
+
+#same dictionary straight from key,value columns (a file path or an open file,
+#here an in-memory one), read in chunks without making one tuple per pair
+print(dict_from_columns(io.StringIO("a,1\nb,2\nc,3\n"), value_type=int))
\ No newline at end of file
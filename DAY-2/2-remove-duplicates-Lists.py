@@ -1,17 +1,12 @@
 # Q2 : Remove duplicates from list
 
+from list_tools import dedupe #hash-based list module (list_tools.py)
+
 #Take input of list
 old_list = list(input("ENTER LIST INPUT: ").split(","))
 
-#Creating new empty list
-new_list = []
-
-#For loop for appending non duplicate elements in new list
-for i in old_list:
-    if i in new_list:
-        continue
-    else:
-        new_list.append(i)
+#Creating new list without duplicates (dict keeps first-seen order, no "in new_list" scans)
+new_list = dedupe(old_list)
 
 #Printing the final new list (without duplicates)
-print(new_list,"is a non duplicate elements version of list",old_list)
\ No newline at end of file
+print(new_list,"is a non duplicate elements version of list",old_list)
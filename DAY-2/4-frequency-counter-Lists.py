@@ -1,14 +1,11 @@
 #Q4 Count frequency of each element in list
 
+from list_tools import frequencies #hash-based list module (list_tools.py)
+
 #list input from user
 list_og = list(input("Enter the list: ").split(","))
 
-counted_list = []
-#counting frequency each element
+#counting frequency each element in one pass (Counter instead of list_og.count per element)
 print("Frequency of each element: ") 
-for i in list_og :
-    if i in counted_list:
-        continue
-    else:
-        print(i,":",list_og.count(i))
-        counted_list.append(i)
\ No newline at end of file
+for i, count in frequencies(list_og).items():
+    print(i,":",count)
@@ -1,14 +1,13 @@
 #Q5 Find common elements between two lists
 
+from list_tools import intersect #hash-based list module (list_tools.py)
+
 #Input both lists from user 
 list1 = list(input("Enter List 1: ").split(","))
 list2 = list(input("Enter List 2: ").split(","))
 
-#Finding common elements 
-common_elements_list=[]
-for i in list1:
-    if i in list2 :
-        common_elements_list.append(i)
+#Finding common elements (set lookup instead of scanning list2 for every element)
+common_elements_list = intersect(list1, list2, keep_repeats=True) #repeats in list1 are kept
 
 #printing the result
-print(common_elements_list,"is list of common elements from",list1,"&",list2)
\ No newline at end of file
+print(common_elements_list,"is list of common elements from",list1,"&",list2)
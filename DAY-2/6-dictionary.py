@@ -1,11 +1,14 @@
 #Q6 Create dictionary from two lists (keys and values)
 
+from dict_builder import build_dict #bulk dict module (dict_builder.py)
+
 #Input both lists from user 
 keys = list(input("Enter List 1: ").split(","))
 values = list(input("Enter List 2: ").split(","))
 
 #combine and create a dictionary
-person = dict(zip(keys,values))
+#on_duplicate decides what happens to repeated keys: "last" (like dict(zip(...))), "first" or "error"
+person = build_dict(keys,values,on_duplicate="last")
 #alternative method is to have a for loop and appending pair of key and value 
 
 #printing result
@@ -1,5 +1,7 @@
 #Q7 Sort dictionary by values
 
+from ranking import RankedDict, top_n_items #ranking module (ranking.py)
+
 #sample data
 scores = {"Alice": 85, "Bob": 92, "Charlie": 78,"Adinath": 98}
 
@@ -8,4 +10,12 @@ scores = {"Alice": 85, "Bob": 92, "Charlie": 78,"Adinath": 98}
 sorted_dictionary = dict(sorted(scores.items(),key=lambda x: x[1])) #sorting by values
 
 #printing the results
-print(sorted_dictionary)
\ No newline at end of file
+print(sorted_dictionary)
+
+#when only the top few are needed, don't sort (and copy) the whole dictionary
+print("Top 2:", top_n_items(scores, 2))
+
+#RankedDict keeps the top 2 up to date on every update, no re-sorting on each read
+ranked = RankedDict(2, scores)
+ranked["Charlie"] = 95
+print("Top 2 after update:", ranked.top())
\ No newline at end of file
@@ -1,5 +1,7 @@
 #Q8 Merge two dictionaries
 
+from merge_layers import merge #layered merge module (merge_layers.py)
+
 # --- Merging Dictionaries ---
 dict1 = {"a": 1, "b": 2}
 dict2 = {"c": 3, "d": 4}
@@ -7,7 +9,8 @@ dict3 = {"b": 5, "e": 6}
 
 #more methods are lists in the DAY-2 overview 
 #merging 3 dictionaries
-merged = {**dict1, **dict2, **dict3}         # Later dicts override earlier ones
+'''merged = {**dict1, **dict2, **dict3}'''    #copies every entry on every merge
+merged = merge(dict1, dict2, dict3)         # Later dicts override earlier ones, nothing is copied
 
-#printing result
-print(merged)
\ No newline at end of file
+#printing result (flatten() builds a plain dict once and caches it)
+print(merged.flatten())
\ No newline at end of file
@@ -3,17 +3,15 @@
 #sample data
 scores = {"Alice": 85, "Bob": 92, "Charlie": 78,"Adinath": 98,"piyush":87,"prajwal":88}
 
-#converting values from dictionary to a list
-values=list(scores.values())
-print(values)
-keys = list(scores.keys()) 
-print(keys)
+#printing values and keys of the dictionary
+print(list(scores.values()))
+print(list(scores.keys()))
 
-#finding maximum value from values
-max_value = max(values)
+#finding maximum value straight from the values view (no list copy needed)
+max_value = max(scores.values())
 print(max_value)
 
-#finding key for the max value 
+#finding every key with the max value (ties are all printed)
 for key, value in scores.items():
     if value == max_value:
         #printing result
@@ -0,0 +1,149 @@
+#Q6 Dictionary from two lists / Q10 List of tuples to dictionary
+#Module : bulk dict construction from key/value columns used by the DAY-2 dict scripts
+
+import io
+import os
+import time
+from collections import deque
+
+#characters read per chunk when streaming a file
+CHUNK_CHARS = 1 << 20
+
+POLICIES = ("first", "last", "error")
+
+
+def _add_columns(result, keys, values, on_duplicate):
+    #one dict.update (or setdefault map) per chunk; no Python-level loop per pair
+    if on_duplicate == "last":
+        result.update(zip(keys, values))
+    elif on_duplicate == "first":
+        #setdefault keeps the existing value; deque(maxlen=0) just drives the map in C
+        deque(map(result.setdefault, keys, values), maxlen=0)
+    else:
+        chunk = dict(zip(keys, values))
+        if len(chunk) != len(keys) or not result.keys().isdisjoint(chunk):
+            seen = set()
+            for key in keys:
+                if key in result or key in seen:
+                    raise KeyError(f"duplicate key: {key!r}")
+                seen.add(key)
+        result.update(chunk)
+    return result
+
+
+def build_dict(keys, values, on_duplicate="last"):
+    """
+    Return a dict from parallel key and value lists (like dict(zip(keys, values))).
+    on_duplicate: "last" keeps the last value, "first" the first one,
+    "error" raises KeyError on a repeated key.
+    """
+    if on_duplicate not in POLICIES:
+        raise ValueError(f"on_duplicate must be one of {POLICIES}")
+    return _add_columns({}, list(keys), list(values), on_duplicate)
+
+
+def _iter_chunks(f, chunk_chars):
+    #yield blocks of whole lines: read a big block, then finish its last line
+    while True:
+        block = f.read(chunk_chars)
+        if not block:
+            return
+        if not block.endswith("\n"):
+            block += f.readline()
+        yield block
+
+
+def _open_source(source):
+    #path -> opened file (a missing path raises FileNotFoundError), file object -> as it is
+    if isinstance(source, (str, bytes, os.PathLike)):
+        return open(source, encoding="utf-8", newline=""), True
+    return source, False
+
+
+def _raise_bad_line(block, first_line, sep, ncols):
+    #report the first non-blank line of the block with the wrong field count
+    for number, line in enumerate(block.split("\n"), first_line):
+        if line and line.count(sep) != ncols - 1:
+            raise ValueError(f"line {number} has {line.count(sep) + 1} fields, expected {ncols}: {line!r}")
+
+
+def dict_from_columns(source, key_col=0, value_col=1, sep=",", on_duplicate="last",
+                      value_type=None, skip_header=False, chunk_chars=CHUNK_CHARS):
+    """
+    Build a dict from two columns of a delimited text source, streaming it in chunks.
+    source: file path or open text file (wrap data held in a str in io.StringIO).
+    Every line must have the same number of fields as the first one (no quoting,
+    like str.split); a line with a different count raises ValueError with its
+    line number. Blank lines are skipped.
+    Each chunk is checked and split once into a flat list of fields; the key and
+    value columns are slices of it, added with one dict.update per chunk.
+    value_type: optional converter such as int or float applied to the values.
+    """
+    if on_duplicate not in POLICIES:
+        raise ValueError(f"on_duplicate must be one of {POLICIES}")
+    f, should_close = _open_source(source)
+    result = {}
+    ncols = None
+    line_number = 1 if skip_header else 0
+    try:
+        if skip_header:
+            f.readline()
+        for block in _iter_chunks(f, chunk_chars):
+            block = raw = block.replace("\r\n", "\n")
+            first_line = line_number + 1
+            line_number += block.count("\n") + (not block.endswith("\n"))
+            block = block.rstrip("\n")
+            if block.startswith("\n") or "\n\n" in block:
+                #drop blank lines (rare, so only then split into lines)
+                block = "\n".join(filter(None, block.split("\n")))
+            if not block:
+                continue
+            if ncols is None:
+                ncols = block.split("\n", 1)[0].count(sep) + 1
+                if max(key_col, value_col) >= ncols:
+                    raise ValueError(f"source has only {ncols} columns")
+            #every newline becomes an extra "\n" field after each line, so with
+            #well-formed lines they all sit at fields[ncols::ncols + 1];
+            #a line with too few or too many fields shifts them off that stride
+            fields = block.replace("\n", sep + "\n" + sep).split(sep)
+            nlines = block.count("\n") + 1
+            if (len(fields) != (ncols + 1) * nlines - 1
+                    or fields[ncols::ncols + 1].count("\n") != nlines - 1):
+                _raise_bad_line(raw, first_line, sep, ncols)
+            stride = ncols + 1
+            keys = fields[key_col::stride]
+            values = fields[value_col::stride]
+            if value_type is not None:
+                values = list(map(value_type, values))
+            _add_columns(result, keys, values, on_duplicate)
+    finally:
+        if should_close:
+            f.close()
+    return result
+
+
+def benchmark(n=1_000_000):
+    #per-line split + tuple per pair vs chunked column slices
+    data = "".join(f"user{i % (n // 2)},{i}\n" for i in range(n))
+
+    start = time.perf_counter()
+    expected = dict(line.split(",") for line in io.StringIO(data).read().splitlines())
+    t_lines = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = dict_from_columns(io.StringIO(data))
+    t_columns = time.perf_counter() - start
+
+    assert result == expected
+    print(f"{n} pairs: split per line {n / t_lines:,.0f} pairs/s, "
+          f"chunked columns {n / t_columns:,.0f} pairs/s")
+
+    for policy in ("first", "last"):
+        start = time.perf_counter()
+        dict_from_columns(io.StringIO(data), on_duplicate=policy, value_type=int)
+        print(f"  on_duplicate={policy!r} with int values: "
+              f"{n / (time.perf_counter() - start):,.0f} pairs/s")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,113 @@
+#Q2 / Q4 / Q5 : remove duplicates, count frequency, common elements
+#Module : hash-based O(n) list operations used by the DAY-2 list scripts
+
+import time
+from collections import Counter
+
+import numpy as np
+
+
+def dedupe(items):
+    """
+    Return items without duplicates, keeping the first-seen order.
+    dict keys are unique and ordered, so this is one O(n) pass.
+    NumPy arrays use np.unique and come back as an array in first-seen order.
+    """
+    if isinstance(items, np.ndarray):
+        _, first_index = np.unique(items, return_index=True)
+        return items[np.sort(first_index)]
+    return list(dict.fromkeys(items))
+
+
+def frequencies(items):
+    """
+    Return a dict {element: count} in first-seen order.
+    NumPy arrays use np.unique(return_counts=True) and return the two arrays
+    (values sorted, counts) so nothing is converted back to Python objects.
+    """
+    if isinstance(items, np.ndarray):
+        return np.unique(items, return_counts=True)
+    return dict(Counter(items))
+
+
+def intersect(list1, list2, multiplicity=False, keep_repeats=False):
+    """
+    Return the elements of list1 that also appear in list2, in list1's order.
+    multiplicity=False -> each common element once
+    multiplicity=True  -> each common element min(count in list1, count in list2) times
+    keep_repeats=True  -> every element of list1 that is in list2, repeats included
+                          (the result of the original loop in 5-common-elements-Lists.py)
+    NumPy arrays use np.intersect1d (sorted, unique) when multiplicity and keep_repeats are False.
+    """
+    if (isinstance(list1, np.ndarray) and isinstance(list2, np.ndarray)
+            and not multiplicity and not keep_repeats):
+        return np.intersect1d(list1, list2)
+    if isinstance(list1, np.ndarray):
+        list1 = list1.tolist()
+    if isinstance(list2, np.ndarray):
+        list2 = list2.tolist()
+    if multiplicity:
+        remaining = Counter(list2)
+        common = []
+        for item in list1:
+            if remaining[item] > 0:
+                remaining[item] -= 1
+                common.append(item)
+        return common
+    lookup = set(list2)
+    if keep_repeats:
+        return [item for item in list1 if item in lookup]
+    return [item for item in dict.fromkeys(list1) if item in lookup]
+
+
+def _dedupe_scan(old_list):
+    #original approach from 2-remove-duplicates-Lists.py
+    new_list = []
+    for i in old_list:
+        if i not in new_list:
+            new_list.append(i)
+    return new_list
+
+
+def _frequencies_scan(list_og):
+    #original approach from 4-frequency-counter-Lists.py
+    counted = {}
+    for i in list_og:
+        if i not in counted:
+            counted[i] = list_og.count(i)
+    return counted
+
+
+def _intersect_scan(list1, list2):
+    #original approach from 5-common-elements-Lists.py
+    return [i for i in list1 if i in list2]
+
+
+def benchmark(sizes=(10**3, 10**4, 10**5, 10**6, 10**7), scan_limit=10**4):
+    #quadratic scans (only up to scan_limit) vs hash-based vs NumPy
+    rng = np.random.default_rng(0)
+    print(f"{'n':>10} {'scan (s)':>10} {'hash (s)':>10} {'numpy (s)':>10}")
+    for n in sizes:
+        arr1 = rng.integers(0, n // 2 + 1, size=n)
+        arr2 = rng.integers(0, n // 2 + 1, size=n)
+        list1, list2 = arr1.tolist(), arr2.tolist()
+
+        t_scan = float("nan")
+        if n <= scan_limit:
+            start = time.perf_counter()
+            _dedupe_scan(list1), _frequencies_scan(list1), _intersect_scan(list1, list2)
+            t_scan = time.perf_counter() - start
+
+        start = time.perf_counter()
+        dedupe(list1), frequencies(list1), intersect(list1, list2)
+        t_hash = time.perf_counter() - start
+
+        start = time.perf_counter()
+        dedupe(arr1), frequencies(arr1), intersect(arr1, arr2)
+        t_numpy = time.perf_counter() - start
+
+        print(f"{n:>10} {t_scan:>10.4f} {t_hash:>10.4f} {t_numpy:>10.4f}")
+
+
+if __name__ == "__main__":
+    benchmark()
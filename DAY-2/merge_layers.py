@@ -0,0 +1,189 @@
+#Q8 Merge dictionaries
+#Module : zero-copy layered merge (ChainMap view) used by 8-merge-dicts.py
+
+import time
+import tracemalloc
+from collections import ChainMap
+
+
+class Layer(dict):
+    """
+    dict that counts its own changes in .version, so a MergedView knows
+    when its cached flat copy is out of date.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.version = 0
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.version += 1
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.version += 1
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self.version += 1
+
+    def pop(self, *args):
+        self.version += 1
+        return super().pop(*args)
+
+    def popitem(self):
+        self.version += 1
+        return super().popitem()
+
+    def setdefault(self, key, default=None):
+        self.version += 1
+        return super().setdefault(key, default)
+
+    def clear(self):
+        super().clear()
+        self.version += 1
+
+
+class MergedView(ChainMap):
+    """
+    Read view over several dicts where the right-most layer wins,
+    the same result as {**layer1, **layer2, ...} but without copying any entry.
+    Lookups try the layers from right to left.
+    flatten() builds a plain dict once and caches it until a layer changes.
+    Changes are detected automatically for Layer objects; after mutating a
+    plain dict in place call invalidate().
+    The view itself is read-only: item assignment, del, pop, popitem, clear
+    and |= raise TypeError (ChainMap would write into the caller's right-most dict).
+    Change a layer or add one with add_layer instead.
+    """
+
+    def __init__(self, *layers):
+        #ChainMap searches left to right, so store the layers reversed
+        super().__init__(*reversed(layers))
+        self._flat = None
+        self._versions = None
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("MergedView is read-only; change a layer or use add_layer()")
+
+    __setitem__ = __delitem__ = pop = popitem = clear = __ior__ = _read_only
+
+    @property
+    def layers(self):
+        """
+        The layers in merge order (left-most first, right-most wins).
+        """
+        return list(reversed(self.maps))
+
+    def add_layer(self, layer):
+        """
+        Put a new layer on top (it wins over all existing ones).
+        """
+        self.maps.insert(0, layer)
+        self.invalidate()
+
+    #ChainMap builds these with its own (left-most wins) argument order
+    def new_child(self, m=None):
+        return self.__class__(*self.layers, {} if m is None else m)
+
+    @property
+    def parents(self):
+        return self.__class__(*self.layers[:-1])
+
+    def copy(self):
+        layers = self.layers
+        return self.__class__(*layers[:-1], layers[-1].copy())
+
+    __copy__ = copy
+
+    def _current_versions(self):
+        return tuple((id(m), getattr(m, "version", None)) for m in self.maps)
+
+    def invalidate(self):
+        """
+        Drop the cached flat dict.
+        """
+        self._flat = None
+        self._versions = None
+
+    def flatten(self):
+        """
+        Return the merged result as a plain dict, rebuilt only when a layer changed.
+        The returned dict is shared with the cache, so treat it as read-only.
+        """
+        versions = self._current_versions()
+        if self._flat is None or versions != self._versions:
+            flat = {}
+            for layer in reversed(self.maps):
+                flat.update(layer)
+            self._flat = flat
+            self._versions = versions
+        return self._flat
+
+
+def merge(*layers, flatten=False):
+    """
+    Merge dictionaries with right-most-wins semantics.
+    flatten=False -> zero-copy MergedView; flatten=True -> one plain merged dict
+    """
+    view = MergedView(*layers)
+    return view.flatten() if flatten else view
+
+
+def benchmark(n=1_000_000, requests=50):
+    #unpacking merge on every request vs one view (and one cached flatten)
+    base = Layer((f"key{i}", i) for i in range(n))
+    site = Layer((f"key{i}", -i) for i in range(0, n, 10))
+    user = Layer({"key1": "override"})
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    for _ in range(requests):
+        merged = {**base, **site, **user}
+        merged["key1"], merged["key10"]
+    t_unpack = (time.perf_counter() - start) / requests
+    _, peak_unpack = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    for _ in range(requests):
+        view = merge(base, site, user)
+        view["key1"], view["key10"]
+    t_view = (time.perf_counter() - start) / requests
+    _, peak_view = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    view = MergedView(base, site, user)
+    view.flatten()
+    start = time.perf_counter()
+    for _ in range(requests):
+        view.flatten()
+    t_cached = (time.perf_counter() - start) / requests
+    assert view.flatten() == {**base, **site, **user}
+
+    #writes through the view must never reach the caller's dicts
+    first, last = {"a": 1}, {"b": 2}
+    view = merge(first, last)
+    for write in (lambda: view.__setitem__("z", 9), lambda: view.__ior__({"z": 9}),
+                  lambda: view.update(z=9), lambda: view.pop("b"), view.clear):
+        try:
+            write()
+        except TypeError:
+            pass
+        else:
+            raise AssertionError("MergedView accepted a write")
+    assert last == {"b": 2} and view.flatten() == {"a": 1, "b": 2}
+
+    print(f"{n} keys, per request: unpacking {t_unpack * 1000:.2f} ms / peak {peak_unpack / 2**20:.1f} MB, "
+          f"view {t_view * 1000:.4f} ms / peak {peak_view / 2**20:.3f} MB, "
+          f"cached flatten {t_cached * 1000:.4f} ms")
+
+
+if __name__ == "__main__":
+    benchmark()
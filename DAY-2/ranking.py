@@ -0,0 +1,295 @@
+#Q1 Second largest number / Q7 Sort dictionary by values / Q9 Key with maximum value
+#Module : single-pass top-k selection and dictionary ranking used by the DAY-2 scripts
+
+import heapq
+import time
+from bisect import insort
+from collections.abc import MutableMapping
+from itertools import count
+
+import numpy as np
+
+
+def _identity(x):
+    return x
+
+
+def _top_2_plain(iterable, distinct):
+    #two variables for plain values (no key calls); one pass, so it also works on
+    #one-shot iterators, but on a list it is not faster than max() + a rescan
+    best = second = None
+    for item in iterable:
+        if best is None or item > best:
+            if best is not None and not (distinct and item == best):
+                second = best
+            best = item
+        elif distinct and item == best:
+            continue
+        elif second is None or item > second:
+            second = item
+    return [x for x in (best, second) if x is not None]
+
+
+def _top_2(iterable, key, distinct):
+    #two variables with a key function: one pass, no heap
+    best = second = None #(key, item) pairs
+    for item in iterable:
+        k = key(item)
+        if best is None or k > best[0]:
+            if best is not None and not (distinct and k == best[0]):
+                second = best
+            best = (k, item)
+        elif distinct and k == best[0]:
+            continue
+        elif second is None or k > second[0]:
+            second = (k, item)
+    return [pair[1] for pair in (best, second) if pair is not None]
+
+
+def _top_k_heap(iterable, k, key, distinct):
+    #bounded min-heap of size k; the counter keeps earlier items ahead on ties
+    heap = []
+    in_heap = set()
+    order = count(0, -1)
+    for item in iterable:
+        k_item = key(item)
+        if distinct and k_item in in_heap:
+            continue
+        if len(heap) < k:
+            heapq.heappush(heap, (k_item, next(order), item))
+            in_heap.add(k_item)
+        elif k_item > heap[0][0]:
+            removed = heapq.heapreplace(heap, (k_item, next(order), item))
+            in_heap.discard(removed[0])
+            in_heap.add(k_item)
+    return [entry[2] for entry in sorted(heap, reverse=True)]
+
+
+def _top_k_array(arr, k, distinct):
+    #np.argpartition finds the k largest in O(n), only those k get sorted
+    if distinct:
+        arr = np.unique(arr)
+    if k >= len(arr):
+        return np.sort(arr)[::-1]
+    idx = np.argpartition(arr, len(arr) - k)[len(arr) - k:]
+    return np.sort(arr[idx])[::-1]
+
+
+def top_k(iterable, k, key=None, distinct=False):
+    """
+    Return the k largest items of iterable, largest first, in one streaming pass.
+    key: function giving the value to compare (like in max/sorted).
+    distinct: count items with equal keys only once (e.g. second largest *value*).
+    Ties keep the item that appeared first. Works for negative numbers too.
+    - NumPy arrays (no key) use np.argpartition
+    - k == 2 keeps just two variables (one pass, no heap)
+    - otherwise a bounded heap of size k
+    """
+    if k <= 0:
+        return []
+    if isinstance(iterable, np.ndarray) and key is None:
+        return _top_k_array(iterable.ravel(), k, distinct)
+    if k == 2:
+        if key is None:
+            return _top_2_plain(iterable, distinct)
+        return _top_2(iterable, key, distinct)
+    key = key or _identity
+    return _top_k_heap(iterable, k, key, distinct)
+
+
+def second_largest(iterable):
+    """
+    Return the second largest distinct value, or None if there is none.
+    """
+    top = top_k(iterable, 2, distinct=True)
+    return top[1] if len(top) == 2 else None
+
+
+#above this share of the dict, a partial sort beats heapq.nlargest
+_PARTIAL_SORT_RATIO = 0.05
+
+
+def _value_of(item):
+    return item[1]
+
+
+def _exact_array(values):
+    #values as an int64 or float64 array, None if that would change any value
+    #(big ints, mixed int/float, bools, non-numbers); then the caller sorts instead
+    kinds = set(map(type, values))
+    try:
+        if kinds <= {int}:
+            return np.fromiter(values, dtype=np.int64, count=len(values))
+        if kinds <= {float}:
+            return np.fromiter(values, dtype=np.float64, count=len(values))
+    except OverflowError:
+        pass
+    return None
+
+
+def top_n_items(mapping, n):
+    """
+    Return the n (key, value) pairs with the largest values, largest first.
+    Small n use heapq.nlargest (O(len * log n)); large n use np.argpartition +
+    sorting only the selected n when the values fit int64 / float64 exactly,
+    a plain sort otherwise. Ties keep dict order.
+    """
+    if n <= 0 or not mapping:
+        return []
+    if n < _PARTIAL_SORT_RATIO * len(mapping):
+        return heapq.nlargest(n, mapping.items(), key=_value_of)
+    if n >= len(mapping):
+        return sorted(mapping.items(), key=_value_of, reverse=True)
+    values = _exact_array(mapping.values())
+    if values is None:
+        return sorted(mapping.items(), key=_value_of, reverse=True)[:n]
+    idx = np.argpartition(values, len(values) - n)[len(values) - n:]
+    threshold = values[idx].min()
+    #include every tie at the boundary; sort by value descending, then dict order
+    candidates = np.flatnonzero(values >= threshold)
+    chosen = candidates[np.lexsort((-candidates, values[candidates]))[::-1]][:n]
+    keys = list(mapping)
+    return [(keys[i], mapping[keys[i]]) for i in chosen.tolist()]
+
+
+class RankedDict(MutableMapping):
+    """
+    Dictionary that keeps its top-n items (by value) up to date on every update,
+    so reading the ranking does not re-sort the whole dict.
+    Raising a value or adding a key adjusts the top list in O(n);
+    lowering or deleting a current top item marks it stale and the next read
+    rebuilds it once with heapq.nlargest.
+    """
+
+    def __init__(self, n, data=None):
+        self.n = n
+        self._data = {}
+        self._top = [] #ascending list of (value, -order, key)
+        self._order = {} #key -> insertion number, used for ties
+        self._counter = count()
+        self._stale = False
+        if data:
+            self.update(data)
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __len__(self):
+        return len(self._data)
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __repr__(self):
+        return f"RankedDict(n={self.n}, {self._data!r})"
+
+    def __setitem__(self, key, value):
+        if key not in self._order:
+            self._order[key] = next(self._counter)
+        old = self._data.get(key)
+        self._data[key] = value
+        if self._stale:
+            return
+        entry = (value, -self._order[key], key)
+        if old is not None and (old, -self._order[key], key) in self._top:
+            if value < old and len(self._data) > len(self._top):
+                #a top item went down: something outside may now beat it
+                self._stale = True
+                return
+            self._top.remove((old, -self._order[key], key))
+            insort(self._top, entry)
+        elif len(self._top) < self.n:
+            insort(self._top, entry)
+        elif entry > self._top[0]:
+            self._top.pop(0)
+            insort(self._top, entry)
+
+    def __delitem__(self, key):
+        value = self._data.pop(key)
+        entry = (value, -self._order.pop(key), key)
+        if not self._stale and entry in self._top:
+            self._stale = True
+
+    def top(self):
+        """
+        Return the top-n (key, value) pairs, largest value first.
+        """
+        if self._stale:
+            self._top = sorted(heapq.nlargest(
+                self.n, ((v, -self._order[k], k) for k, v in self._data.items())))
+            self._stale = False
+        return [(key, value) for value, _, key in reversed(self._top)]
+
+
+def _second_largest_rescan(numbers):
+    #original approach from 1-2nd-large-LISTS.py (max then rescan, seeded with -1)
+    max_number = max(numbers)
+    second_max = -1
+    for i in numbers:
+        if i > second_max and i != max_number:
+            second_max = i
+    return second_max
+
+
+def benchmark(n=2_000_000):
+    #max-then-rescan vs one pass (about the same speed on a list; the one pass also
+    #handles iterators and negative numbers), and bigger k with heap vs full sort vs argpartition
+    arr = np.random.default_rng(0).integers(0, 10**9, size=n)
+    numbers = arr.tolist()
+
+    start = time.perf_counter()
+    expected = _second_largest_rescan(numbers)
+    t_old = time.perf_counter() - start
+    start = time.perf_counter()
+    result = second_largest(numbers)
+    t_new = time.perf_counter() - start
+    assert result == expected
+    print(f"second largest of {n}: max + rescan {t_old:.3f} s, one pass {t_new:.3f} s")
+
+    k = 100
+    start = time.perf_counter()
+    expected = sorted(numbers, reverse=True)[:k]
+    t_sort = time.perf_counter() - start
+    start = time.perf_counter()
+    heap_result = top_k(numbers, k)
+    t_heap = time.perf_counter() - start
+    start = time.perf_counter()
+    array_result = top_k(arr, k)
+    t_array = time.perf_counter() - start
+    assert heap_result == expected == array_result.tolist()
+    print(f"top {k} of {n}: full sort {t_sort:.3f} s, heap {t_heap:.3f} s, "
+          f"argpartition {t_array:.4f} s")
+
+    #top-N of a dict: full sorted() vs top_n_items
+    scores = dict(zip(map(str, range(n)), numbers))
+    for top_n in (3, n // 10):
+        start = time.perf_counter()
+        expected = sorted(scores.items(), key=_value_of, reverse=True)[:top_n]
+        t_sort = time.perf_counter() - start
+        start = time.perf_counter()
+        result = top_n_items(scores, top_n)
+        t_rank = time.perf_counter() - start
+        assert [v for _, v in result] == [v for _, v in expected]
+        print(f"top {top_n} of a {n}-key dict: sorted {t_sort:.3f} s, top_n_items {t_rank:.3f} s")
+
+    #reading the top 3 after every update: re-sorting vs RankedDict
+    updates = list(zip(map(str, np.random.default_rng(1).integers(0, 1000, 20_000).tolist()),
+                       np.random.default_rng(2).integers(0, 10**9, 20_000).tolist()))
+    plain = dict(zip(map(str, range(1000)), numbers[:1000]))
+    ranked = RankedDict(3, plain)
+    start = time.perf_counter()
+    for key, value in updates:
+        plain[key] = value
+        sorted(plain.items(), key=_value_of, reverse=True)[:3]
+    t_sort = time.perf_counter() - start
+    start = time.perf_counter()
+    for key, value in updates:
+        ranked[key] = value
+        ranked.top()
+    t_ranked = time.perf_counter() - start
+    assert [v for _, v in ranked.top()] == [v for _, v in top_n_items(plain, 3)]
+    print(f"{len(updates)} updates + reads: re-sort {t_sort:.3f} s, RankedDict {t_ranked:.3f} s")
+
+
+if __name__ == "__main__":
+    benchmark()
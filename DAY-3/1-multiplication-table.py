@@ -1,8 +1,12 @@
 #Q1 Print multiplication table
+#Batch mode: python 1-multiplication-table.py --number 7 --rows 12 --out table.txt
 
-#Input
-number = int(input("Enter the number for multiplication table: "))
+from pattern_render import batch_args, multiplication_table_rows, render #renderer module (pattern_render.py)
 
-#Printing Multiplication Table
-for i in range(1,13):
-    print(number,"✖",i,"=",number*i)
\ No newline at end of file
+args = batch_args("Print a multiplication table", number=True)
+
+#Input (only when --number is not given)
+number = args.number if args.number is not None else int(input("Enter the number for multiplication table: "))
+
+#Printing Multiplication Table through one buffered writer
+render(multiplication_table_rows(number, args.rows or 12), args.out)
\ No newline at end of file
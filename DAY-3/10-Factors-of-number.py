@@ -1,15 +1,13 @@
 #Q10 Print all factors of a number
 
+from factorize import divisors #factorisation module (factorize.py)
+
 #Take input
 a = int(input("Enter second number: "))
 
-#factors of each number
-factors1 = []
-
-#factors of number a
-for i in range(1, a + 1):
-    if a % i == 0:
-        factors1.append(i)
+#factors of number a, generated from its prime factorisation
+#(instead of testing every i from 1 to a)
+factors1 = divisors(a)
 
 #printing result
 print(factors1,"are factors of",a)
\ No newline at end of file
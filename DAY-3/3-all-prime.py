@@ -1,18 +1,13 @@
 #Q3 Find all prime numbers up to N
 
+from prime_sieve import primes_up_to #segmented sieve module (prime_sieve.py)
+
 #Input number for N
 num = int(input("Enter the number: "))
 
-#Empty prime numbers from 0 to N numbers
-Prime_numbers = []
-
-#Creating the list
-for element in range(2,num+1):
-        for i in range(2, element):
-            if element % i == 0:
-                break
-        else:
-            Prime_numbers.append(element)
+#Creating the list of prime numbers from 0 to N numbers
+#(sieve of Eratosthenes instead of checking every element by trial division)
+Prime_numbers = primes_up_to(num)
 
 #Printing the list
 if len(Prime_numbers) > 0:
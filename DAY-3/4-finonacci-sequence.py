@@ -1,15 +1,11 @@
 #Q4 Fibonacci sequence generator
 
+from fibonacci import fib_stream #fast-doubling Fibonacci module (fibonacci.py)
+
 #Input
 num = int(input("Enter the number: "))
 
-#Initialize a and b
-a = 0
-b = 1
-
 #for loop for printing Fibonacci sequence
-for i in range(num):
-    print(a, end=" ")
-    c = a+b
-    a = b
-    b = c
\ No newline at end of file
+#(fib_stream(start, count) can also begin at any index, e.g. fib_stream(10**6, 5))
+for term in fib_stream(0, num):
+    print(term, end=" ")
\ No newline at end of file
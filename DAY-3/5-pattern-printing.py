@@ -1,32 +1,12 @@
 #Q5 Pattern Printing
+#Batch mode: python 5-pattern-printing.py --rows 10000 --out patterns.txt
 
-#Taking input
-n = int(input("Enter the number of rows: "))
+from pattern_render import batch_args, pattern_rows, render #renderer module (pattern_render.py)
 
-#printing first pattern
-print("First Pattern: ")
-for i in range(1,n+1):
-    print("*"*i)
+args = batch_args("Print four star patterns")
 
-print("-------------------------------------------------------------------------------------------------") 
+#Taking input (only when --rows is not given)
+n = args.rows if args.rows is not None else int(input("Enter the number of rows: "))
 
-#printing second pattern
-print("Second Pattern: ")
-for i in range(n,0,-1):
-    print("*"*i)
-
-print("-------------------------------------------------------------------------------------------------") 
-
-#printing third pattern
-print("Third Pattern: ")
-for i in range(n+1):
-    print(" "*(n-i) + "*"*(2*i-1))
-
-print("-------------------------------------------------------------------------------------------------") 
-
-#printing fourth pattern
-print("Fourth Pattern: ")
-for i in range(n+1):
-    print(" "*(n-i)+"*"*i)
-
-print("-------------------------------------------------------------------------------------------------") 
\ No newline at end of file
+#printing all four patterns with one buffered writer instead of print() per row
+render(pattern_rows(n), args.out)
\ No newline at end of file
@@ -1,14 +1,12 @@
 #Q6 Sum of digits in number
 
+from digit_ops import digit_sum #digit operations module (digit_ops.py)
+
 #Input
 number = input("Enter Number: ")
 
-#Init sum as 0
-sum = 0
-
-#Sum of digits of the number
-for i in number:
-    sum = sum + int(i)
+#Sum of digits of the number (divmod by 10, no loop over characters)
+sum = digit_sum(int(number))
 
 #printing the result
 print(sum,"is sum of digits of given number:",number)
\ No newline at end of file
@@ -1,10 +1,12 @@
 #Q7 Reverse the input number
 
+from digit_ops import reverse_digits #digit operations module (digit_ops.py)
+
 #Input
 number = input("Enter Number: ")
 
 #reverse the number
-reversed_number = number[::-1]
+reversed_number = reverse_digits(int(number))
 
 #printing the reversed number of input number
-print(int(reversed_number))
\ No newline at end of file
+print(reversed_number)
\ No newline at end of file
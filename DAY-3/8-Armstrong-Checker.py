@@ -1,20 +1,13 @@
 #Q8 Armstrong Number Checker
 
+from armstrong import is_armstrong #Armstrong module (armstrong.py)
+
 #Input
 number = input("Enter Number: ")
 
-#finding the lenght of or no of digits in the Number
-n = len(number)
-
-#Init sum as 0
-sum = 0
-
-#Sum of digits of the number
-for i in number:
-    sum = sum + int(i)**n
-
+#Sum of digits raised to the number of digits, using precomputed digit-power tables
 #Printing the final result
-if (sum == int(number)):
+if is_armstrong(int(number)):
     print(number,"is a Armstrong Number.")
-else: 
+else:
     print(number,"is not a Armstrong Number.")
\ No newline at end of file
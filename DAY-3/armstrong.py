@@ -0,0 +1,104 @@
+#Q8 Armstrong Number Checker
+#Module : Armstrong (narcissistic) number scanner used by 8-Armstrong-Checker.py
+
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import combinations_with_replacement
+
+DIGITS = "0123456789"
+
+
+@lru_cache(maxsize=None)
+def digit_power_table(k):
+    """
+    Return a tuple t with t[d] == d**k for the digits 0..9 (cached per k).
+    """
+    return tuple(d ** k for d in range(10))
+
+
+def is_armstrong(number):
+    """
+    Return True if number equals the sum of its digits each raised to the
+    number of digits, e.g. 153 = 1^3 + 5^3 + 3^3.
+    """
+    if number < 0:
+        return False
+    table = digit_power_table(len(str(number)))
+    total = 0
+    n = number
+    while True:
+        n, d = divmod(n, 10)
+        total += table[d]
+        if n == 0:
+            break
+    return total == number
+
+
+def armstrong_of_length(k):
+    """
+    Return the sorted Armstrong numbers with exactly k digits.
+    The digit-power sum only depends on which digits occur, so we enumerate
+    digit multisets (combinations with replacement, C(k+9, 9) of them)
+    instead of all 9 * 10**(k-1) integers.
+    """
+    table = digit_power_table(k)
+    power = {c: table[int(c)] for c in DIGITS}
+    low, high = (0 if k == 1 else 10 ** (k - 1)), 10 ** k
+    found = []
+    for combo in combinations_with_replacement(DIGITS, k):
+        total = sum(power[c] for c in combo)
+        #the sum must have k digits and be made of exactly these digits
+        if low <= total < high and "".join(sorted(str(total))) == "".join(combo):
+            found.append(total)
+    return sorted(found)
+
+
+def armstrong_up_to(k, processes=None):
+    """
+    Return every Armstrong number below 10**k.
+    Each digit length is independent, so lengths can run in a process pool.
+    """
+    lengths = range(1, k + 1)
+    if not processes or processes == 1:
+        results = map(armstrong_of_length, lengths)
+        return [n for group in results for n in group]
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        #longest lengths first so the slowest jobs start early
+        results = dict(zip(reversed(lengths), pool.map(armstrong_of_length, reversed(lengths))))
+    return [n for length in lengths for n in results[length]]
+
+
+def armstrong_by_scan(limit):
+    """
+    Original string-based check applied to every integer below limit (reference).
+    """
+    found = []
+    for value in range(limit):
+        number = str(value)
+        n = len(number)
+        if sum(int(i) ** n for i in number) == value:
+            found.append(value)
+    return found
+
+
+def benchmark():
+    #scan every integer vs enumerate digit multisets
+    for k in (5, 6):
+        start = time.perf_counter()
+        expected = armstrong_by_scan(10 ** k)
+        t_old = time.perf_counter() - start
+        start = time.perf_counter()
+        result = armstrong_up_to(k)
+        t_new = time.perf_counter() - start
+        assert result == expected
+        print(f"below 10^{k}: scan {t_old:.3f} s, multisets {t_new:.4f} s")
+
+    start = time.perf_counter()
+    result = armstrong_up_to(12, processes=4)
+    print(f"below 10^12: {len(result)} numbers in {time.perf_counter() - start:.2f} s (4 processes)")
+    print(result)
+
+
+if __name__ == "__main__":
+    benchmark()
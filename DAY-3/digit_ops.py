@@ -0,0 +1,146 @@
+#Q6 Sum of digits / Q7 Reverse the number
+#Module : digit operations on scalars and NumPy int64 / uint64 arrays (no string conversion)
+
+import time
+
+import numpy as np
+
+
+#largest value a uint64 can hold
+_UINT64_MAX = np.uint64(2**64 - 1)
+
+
+def _as_array(n):
+    #returns (uint64 array of absolute values, was_scalar, signed input)
+    #the magnitudes are uint64 so that |-2**63| and values >= 2**63 do not wrap
+    arr = np.asarray(n)
+    if arr.dtype.kind not in "iu":
+        raise TypeError("digit operations need integers")
+    if arr.dtype.kind == "u":
+        return arr.astype(np.uint64), arr.ndim == 0, False
+    return np.abs(arr.astype(np.int64)).view(np.uint64), arr.ndim == 0, True
+
+
+def digit_sum(n):
+    """
+    Return the sum of the decimal digits of n (sign ignored).
+    Works on an int or element-wise on an integer NumPy array.
+    """
+    if isinstance(n, int):
+        n, total = abs(n), 0
+        while n:
+            n, d = divmod(n, 10)
+            total += d
+        return total
+    arr, scalar, _ = _as_array(n)
+    total = np.zeros(arr.shape, dtype=np.int64)
+    while arr.any():
+        arr, d = np.divmod(arr, 10)
+        total += d.astype(np.int64)
+    return int(total) if scalar else total
+
+
+def reverse_digits(n):
+    """
+    Return n with its decimal digits reversed (sign kept, leading zeros dropped),
+    e.g. 1200 -> 21. Works on an int or element-wise on an integer NumPy array.
+    Arrays give int64 results (uint64 for unsigned input); a reversed value
+    that does not fit raises OverflowError instead of wrapping around.
+    """
+    if isinstance(n, int):
+        sign = -1 if n < 0 else 1
+        n, result = abs(n), 0
+        while n:
+            n, d = divmod(n, 10)
+            result = result * 10 + d
+        return sign * result
+    arr, scalar, signed = _as_array(n)
+    negative = np.asarray(n) < 0 if signed else None
+    result = np.zeros_like(arr)
+    while arr.any():
+        #numbers that are already finished keep their value
+        active = arr > 0
+        arr, d = np.divmod(arr, 10)
+        if (active & (result > (_UINT64_MAX - d) // 10)).any():
+            raise OverflowError("reversed value does not fit in 64 bits")
+        result = np.where(active, result * 10 + d, result)
+    if not signed:
+        return int(result) if scalar else result
+    #int64 holds magnitudes up to 2**63 - 1 (2**63 for negative values)
+    if (result > np.where(negative, np.uint64(2**63), np.uint64(2**63 - 1))).any():
+        raise OverflowError("reversed value does not fit in int64")
+    result = np.where(negative, -result.view(np.int64), result.view(np.int64))
+    return int(result) if scalar else result
+
+
+def digital_root(n):
+    """
+    Return the repeated digit sum of n until one digit is left (0 for 0).
+    Uses the closed form 1 + (n - 1) % 9, so it is O(1) per value.
+    """
+    if isinstance(n, int):
+        n = abs(n)
+        return 0 if n == 0 else 1 + (n - 1) % 9
+    arr, scalar, _ = _as_array(n)
+    result = np.where(arr == 0, 0, 1 + (arr - 1) % 9).astype(np.int64)
+    return int(result) if scalar else result
+
+
+def digit_count(n):
+    """
+    Return the number of decimal digits of n (1 for 0).
+    """
+    if isinstance(n, int):
+        return len(str(abs(n)))
+    arr, scalar, _ = _as_array(n)
+    count = np.ones(arr.shape, dtype=np.int64)
+    arr = arr // 10
+    while arr.any():
+        count += arr > 0
+        arr //= 10
+    return int(count) if scalar else count
+
+
+def benchmark(n=300_000):
+    #string path (as in 6-Sum-of-digits and 7-reverse-number) vs array divmod
+    numbers = np.random.default_rng(0).integers(0, 10**12, size=n)
+    as_text = [str(x) for x in numbers.tolist()]
+
+    start = time.perf_counter()
+    sums = [sum(int(c) for c in s) for s in as_text]
+    reversed_numbers = [int(s[::-1]) for s in as_text]
+    t_str = time.perf_counter() - start
+
+    start = time.perf_counter()
+    vec_sums = digit_sum(numbers)
+    vec_reversed = reverse_digits(numbers)
+    t_vec = time.perf_counter() - start
+
+    assert vec_sums.tolist() == sums and vec_reversed.tolist() == reversed_numbers
+    print(f"{n} numbers: string path {t_str:.2f} s ({n / t_str:,.0f}/s), "
+          f"NumPy divmod {t_vec:.3f} s ({n / t_vec:,.0f}/s)")
+
+    #64-bit edge cases: magnitudes are uint64, so nothing wraps or loops forever
+    edges = [0, 7, -7, 1200, -1200, 2**63 - 1, -2**63 + 1, -2**63]
+    signed = np.array(edges, dtype=np.int64)
+    unsigned = np.array([0, 2**63, 2**63 + 5, 2**64 - 1, 10**19], dtype=np.uint64)
+    for values in (signed, unsigned):
+        ints = [int(x) for x in values]
+        assert digit_sum(values).tolist() == [digit_sum(x) for x in ints]
+        assert digit_count(values).tolist() == [digit_count(x) for x in ints]
+        assert digital_root(values).tolist() == [digital_root(x) for x in ints]
+    fits = np.array([0, -7, 1200, -1200, 2**63 - 1, -2**63], dtype=np.int64)
+    assert reverse_digits(fits).tolist() == [reverse_digits(int(x)) for x in fits]
+    assert reverse_digits(np.array([2**63 + 5, 10**19 + 1], dtype=np.uint64)).tolist() == \
+        [reverse_digits(2**63 + 5), reverse_digits(10**19 + 1)]
+    for too_big in (np.array([10**18 + 99]), np.array([-10**18 - 99]), np.array([2**64 - 1], dtype=np.uint64)):
+        try:
+            reverse_digits(too_big)
+        except OverflowError:
+            pass
+        else:
+            raise AssertionError(f"{too_big} should not fit once reversed")
+
+
+if __name__ == "__main__":
+    benchmark()
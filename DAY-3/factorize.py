@@ -0,0 +1,173 @@
+#Q10 Print all factors of a number
+#Module : prime factorisation and divisors used by 10-Factors-of-number.py
+
+import math
+import random
+import time
+from functools import lru_cache
+
+from prime_sieve import simple_sieve #bytearray sieve (prime_sieve.py)
+from primality import is_probable_prime #Miller–Rabin (primality.py)
+
+#numbers below this are factorised by trial division (at most 31 divisions)
+TRIAL_LIMIT = 1 << 14
+
+#numbers up to this limit are factorised with the smallest-prime-factor table
+SPF_LIMIT = 10**6
+
+#primes used for trial division before Pollard's rho
+TRIAL_PRIMES = simple_sieve(1000)
+
+_spf = [0, 1] #_spf[i] == smallest prime factor of i, grown on demand
+
+
+def spf_table(n):
+    """
+    Return a list spf where spf[i] is the smallest prime factor of i (2 <= i <= n).
+    The table is built lazily: it grows (at least doubling, at most SPF_LIMIT)
+    only when a bigger n is asked for, so small queries never pay for 10**6 entries.
+    """
+    global _spf
+    if n >= len(_spf):
+        limit = min(max(n, 2 * len(_spf)), SPF_LIMIT)
+        spf = list(range(limit + 1))
+        #largest primes first, so the smallest prime factor is written last
+        for p in reversed(simple_sieve(math.isqrt(limit))):
+            spf[p * p::p] = [p] * len(range(p * p, limit + 1, p))
+        _spf = spf
+    return _spf
+
+
+def pollard_brent(n):
+    """
+    Return a non-trivial factor of the composite odd number n.
+    Pollard's rho with Brent's cycle detection and batched gcd.
+    """
+    if n % 2 == 0:
+        return 2
+    while True:
+        y = random.randrange(1, n)
+        c = random.randrange(1, n)
+        m = 128 #number of steps multiplied together before one gcd
+        g = r = q = 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(m, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += m
+            r *= 2
+        if g == n:
+            #the batch overshot, redo it one step at a time
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = math.gcd(abs(x - ys), n)
+        if g != n:
+            return g
+
+
+def _factor_into(n, factors):
+    #add the prime factors of n (no small factors left) to the dict
+    if n == 1:
+        return
+    if is_probable_prime(n):
+        factors[n] = factors.get(n, 0) + 1
+        return
+    d = pollard_brent(n)
+    _factor_into(d, factors)
+    _factor_into(n // d, factors)
+
+
+@lru_cache(maxsize=4096)
+def _factorize_cached(n):
+    factors = {}
+    if TRIAL_LIMIT <= n <= SPF_LIMIT:
+        spf = spf_table(n)
+        while n > 1:
+            p = spf[n]
+            factors[p] = factors.get(p, 0) + 1
+            n //= p
+        return tuple(factors.items())
+
+    for p in TRIAL_PRIMES:
+        if p * p > n:
+            break
+        while n % p == 0:
+            factors[p] = factors.get(p, 0) + 1
+            n //= p
+    if n > 1:
+        _factor_into(n, factors)
+    return tuple(sorted(factors.items()))
+
+
+def prime_factors(n):
+    """
+    Return the prime factorisation of n as a dict {prime: exponent}.
+    Small n use trial division, n up to SPF_LIMIT the SPF table and large n
+    trial division + Pollard's rho.
+    Results are memoised (LRU), so repeated queries are instant.
+    """
+    if n < 1:
+        raise ValueError("n must be a positive integer")
+    return dict(_factorize_cached(n))
+
+
+def divisors(n):
+    """
+    Return the sorted list of all divisors of n, built from its prime factorisation.
+    """
+    divs = [1]
+    for p, e in prime_factors(n).items():
+        #multiply every divisor found so far by p, p^2, ..., p^e
+        divs = [d * p**k for d in divs for k in range(e + 1)]
+    return sorted(divs)
+
+
+def divisors_by_scan(a):
+    """
+    Original approach from 10-Factors-of-number.py, kept as reference.
+    Time: O(n)
+    """
+    return [i for i in range(1, a + 1) if a % i == 0]
+
+
+def benchmark():
+    #first call for a small n: trial division, no table to build
+    start = time.perf_counter()
+    assert divisors(36) == divisors_by_scan(36)
+    print(f"{36:>20} first call {time.perf_counter() - start:.6f} s")
+
+    #compare the linear scan with the factorisation approach
+    #(720720 includes growing the SPF table up to it)
+    for n in (720_720, 9_699_690, 30_030_000):
+        start = time.perf_counter()
+        expected = divisors_by_scan(n)
+        t_old = time.perf_counter() - start
+        _factorize_cached.cache_clear()
+        start = time.perf_counter()
+        result = divisors(n)
+        t_new = time.perf_counter() - start
+        assert result == expected
+        print(f"{n:>20} scan {t_old:.4f} s   factorise {t_new:.6f} s")
+
+    #numbers around 10^15 and beyond, only reachable with Pollard's rho
+    for n in (10**15 + 37, 999_999_000_001 * 1_000_003, 2**61 - 1, 600_851_475_143 * 1_000_000_007):
+        start = time.perf_counter()
+        count = len(divisors(n))
+        t_first = time.perf_counter() - start
+        start = time.perf_counter()
+        divisors(n)
+        t_cached = time.perf_counter() - start
+        print(f"{n:>20} {prime_factors(n)} -> {count} divisors, "
+              f"first {t_first:.4f} s, cached {t_cached:.6f} s")
+
+
+if __name__ == "__main__":
+    benchmark()
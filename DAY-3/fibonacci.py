@@ -0,0 +1,97 @@
+#Q4 Fibonacci sequence generator
+#Module : fast-doubling Fibonacci used by 4-finonacci-sequence.py
+
+import time
+
+
+def fib_pair(n):
+    """
+    Return (F(n), F(n+1)) with the fast-doubling identities
+        F(2k)   = F(k) * (2*F(k+1) - F(k))
+        F(2k+1) = F(k)^2 + F(k+1)^2
+    Time: O(log n) big-int multiplications
+    """
+    if n < 0:
+        raise ValueError("n must be >= 0")
+    a, b = 0, 1 #F(0), F(1)
+    for bit in bin(n)[2:]: #most significant bit first
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        a, b = (d, c + d) if bit == "1" else (c, d)
+    return a, b
+
+
+def fib(n):
+    """
+    Return the n-th Fibonacci number F(n), with F(0) = 0 and F(1) = 1.
+    """
+    return fib_pair(n)[0]
+
+
+def fib_mod(n, m):
+    """
+    Return F(n) mod m without ever building the huge F(n).
+    """
+    if n < 0:
+        raise ValueError("n must be >= 0")
+    if m <= 0:
+        raise ValueError("m must be > 0")
+    a, b = 0, 1 % m
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a) % m
+        d = (a * a + b * b) % m
+        a, b = (d, (c + d) % m) if bit == "1" else (c, d)
+    return a
+
+
+def fib_stream(start=0, count=None, m=None):
+    """
+    Yield F(start), F(start+1), ... (count terms, or forever if count is None).
+    The first pair is found by fast doubling, so starting at 10**6 costs
+    O(log n) instead of walking a million additions.
+    m: optional modulus applied to every term.
+    """
+    a, b = fib_pair(start)
+    if m is not None:
+        a, b = a % m, b % m
+    produced = 0
+    while count is None or produced < count:
+        yield a
+        a, b = b, a + b if m is None else (a + b) % m
+        produced += 1
+
+
+def fibonacci_gen(num):
+    """
+    Original generator from DAY-8/Q5-Day-8.py, kept as reference for the benchmark.
+    """
+    a = 0
+    b = 1
+    for i in range(num):
+        yield a
+        a, b = b, a + b
+
+
+def benchmark(indices=(10_000, 100_000, 300_000)):
+    #time to reach F(n) by walking the old generator vs fast doubling
+    print(f"{'n':>10} {'generator (s)':>15} {'fast doubling (s)':>18}")
+    for n in indices:
+        start = time.perf_counter()
+        for value in fibonacci_gen(n + 1):
+            pass
+        t_old = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = fib(n)
+        t_new = time.perf_counter() - start
+
+        assert result == value
+        print(f"{n:>10} {t_old:>15.4f} {t_new:>18.6f}")
+
+    start = time.perf_counter()
+    print(f"F(10^18) mod 10^9+7 = {fib_mod(10**18, 10**9 + 7)} "
+          f"in {time.perf_counter() - start:.6f} s")
+
+
+if __name__ == "__main__":
+    benchmark()
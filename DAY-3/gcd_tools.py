@@ -0,0 +1,131 @@
+#Q9 Find GCD of Two Numbers
+#Module : GCD / LCM helpers used by 9-Find-GCD.py
+
+import math
+import time
+from functools import reduce
+
+import numpy as np
+
+
+def gcd_euclid(a, b):
+    """
+    Return gcd(a, b) with Euclid's algorithm (repeated remainder).
+    Time: O(log min(a, b))
+    """
+    a, b = abs(a), abs(b)
+    while b:
+        a, b = b, a % b
+    return a
+
+
+def gcd_binary(a, b):
+    """
+    Return gcd(a, b) with Stein's binary algorithm (shifts and subtraction only).
+    """
+    a, b = abs(a), abs(b)
+    if a == 0:
+        return b
+    if b == 0:
+        return a
+    #common power of two
+    shift = ((a | b) & -(a | b)).bit_length() - 1
+    a >>= (a & -a).bit_length() - 1
+    while b:
+        b >>= (b & -b).bit_length() - 1
+        if a > b:
+            a, b = b, a
+        b -= a
+    return a << shift
+
+
+def gcd(a, b):
+    """
+    Return gcd(a, b). Uses math.gcd, which is implemented in C.
+    """
+    return math.gcd(a, b)
+
+
+def lcm(a, b):
+    """
+    Return the least common multiple of a and b (0 if either is 0).
+    """
+    if a == 0 or b == 0:
+        return 0
+    return abs(a // math.gcd(a, b) * b)
+
+
+def extended_gcd(a, b):
+    """
+    Return (g, x, y) such that a*x + b*y == g == gcd(a, b).
+    Iterative, so it works for very large inputs.
+    """
+    old_r, r = a, b
+    old_x, x = 1, 0
+    old_y, y = 0, 1
+    while r:
+        q = old_r // r
+        old_r, r = r, old_r - q * r
+        old_x, x = x, old_x - q * x
+        old_y, y = y, old_y - q * y
+    if old_r < 0:
+        old_r, old_x, old_y = -old_r, -old_x, -old_y
+    return old_r, old_x, old_y
+
+
+def gcd_many(values):
+    """
+    Return the GCD of all given integers.
+    Values that fit in int64 are reduced with np.gcd.reduce, bigger ones with math.gcd.
+    """
+    arr = np.asarray(values)
+    if arr.size == 0:
+        return 0
+    if arr.dtype.kind in "iu":
+        return int(np.gcd.reduce(arr.ravel()))
+    return reduce(math.gcd, (int(v) for v in arr.ravel()), 0)
+
+
+def lcm_many(values):
+    """
+    Return the LCM of all given integers (exact Python ints, no overflow).
+    """
+    return reduce(lcm, (int(v) for v in values), 1)
+
+
+def gcd_by_factors(a, b):
+    """
+    Original approach from 9-Find-GCD.py, kept as reference for the benchmark.
+    Time: O(a + b + |f1|*|f2|)
+    """
+    factors1 = [i for i in range(1, a + 1) if a % i == 0]
+    factors2 = [i for i in range(1, b + 1) if b % i == 0]
+    common_elements_list = []
+    for i in factors1:
+        if i in factors2:
+            common_elements_list.append(i)
+    return max(common_elements_list)
+
+
+def benchmark(pairs=((1_000, 750), (100_000, 75_000), (2_000_000, 1_500_000))):
+    #time each GCD implementation on the same pairs
+    methods = [("factor lists", gcd_by_factors), ("euclid", gcd_euclid),
+               ("binary", gcd_binary), ("math.gcd", gcd)]
+    print(f"{'a':>10} {'b':>10} " + " ".join(f"{name + ' (s)':>18}" for name, _ in methods))
+    for a, b in pairs:
+        timings = []
+        expected = math.gcd(a, b)
+        for name, func in methods:
+            start = time.perf_counter()
+            assert func(a, b) == expected, name
+            timings.append(time.perf_counter() - start)
+        print(f"{a:>10} {b:>10} " + " ".join(f"{t:>18.6f}" for t in timings))
+
+    arr = np.random.default_rng(0).integers(1, 10**6, size=1_000_000) * 6
+    start = time.perf_counter()
+    g = gcd_many(arr)
+    print(f"gcd_many over 10^6 values = {g} in {time.perf_counter() - start:.4f} s")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,129 @@
+#Q1 Print multiplication table / Q5 Pattern Printing
+#Module : row generators + one buffered writer used by 1-multiplication-table.py and 5-pattern-printing.py
+
+import argparse
+import contextlib
+import os
+import sys
+import time
+
+SEPARATOR = "-" * 97
+
+#characters collected before one write() call
+BATCH_CHARS = 1 << 16
+
+
+def multiplication_table_rows(number, rows=12):
+    """
+    Yield the lines of the multiplication table of number, from 1 to rows.
+    """
+    for i in range(1, rows + 1):
+        yield f"{number} ✖ {i} = {number * i}"
+
+
+def pattern_rows(n):
+    """
+    Yield the lines of the four star patterns of 5-pattern-printing.py, with separators.
+    """
+    yield "First Pattern: "
+    for i in range(1, n + 1):
+        yield "*" * i
+    yield SEPARATOR
+
+    yield "Second Pattern: "
+    for i in range(n, 0, -1):
+        yield "*" * i
+    yield SEPARATOR
+
+    yield "Third Pattern: "
+    for i in range(n + 1):
+        yield " " * (n - i) + "*" * (2 * i - 1)
+    yield SEPARATOR
+
+    yield "Fourth Pattern: "
+    for i in range(n + 1):
+        yield " " * (n - i) + "*" * i
+    yield SEPARATOR
+
+
+def write_rows(rows, stream=None, batch_chars=BATCH_CHARS):
+    """
+    Write rows (strings without newline) to stream, joining about batch_chars
+    characters into each write call instead of one print() per line.
+    Returns the number of rows written.
+    """
+    if stream is None:
+        stream = sys.stdout
+    chunk, size, count = [], 0, 0
+    for row in rows:
+        chunk.append(row)
+        size += len(row) + 1
+        if size >= batch_chars:
+            chunk.append("")
+            stream.write("\n".join(chunk))
+            count += len(chunk) - 1
+            chunk, size = [], 0
+    if chunk:
+        chunk.append("")
+        stream.write("\n".join(chunk))
+        count += len(chunk) - 1
+    stream.flush()
+    return count
+
+
+@contextlib.contextmanager
+def open_output(path=None):
+    """
+    Yield a text stream for path ("-" or None means stdout), opened with a 1 MB buffer.
+    """
+    if path is None or path == "-":
+        yield sys.stdout
+    else:
+        with open(path, "w", encoding="utf-8", buffering=1 << 20) as f:
+            yield f
+
+
+def render(rows, out=None):
+    """
+    Write rows to the file out (or stdout) through one buffered writer.
+    """
+    with open_output(out) as stream:
+        return write_rows(rows, stream)
+
+
+def batch_args(description, argv=None, number=False):
+    """
+    Parse the --rows/--out options (and --number if asked) shared by the scripts.
+    When --rows is not given the scripts fall back to asking with input().
+    """
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--rows", type=int, help="number of rows (skips the input prompt)")
+    parser.add_argument("--out", help="write to this file instead of stdout")
+    if number:
+        parser.add_argument("--number", type=int, help="number for the table (skips the input prompt)")
+    return parser.parse_args(argv)
+
+
+def benchmark():
+    #print() per row vs batched writes into a line-buffered file (like a terminal or `python -u`)
+    cases = [("multiplication table, 10^5 rows", lambda: multiplication_table_rows(7, 100_000)),
+             ("patterns, n=2000", lambda: pattern_rows(2000))]
+    for name, make_rows in cases:
+        with open(os.devnull, "w", encoding="utf-8", buffering=1) as sink:
+            start = time.perf_counter()
+            count = 0
+            for row in make_rows():
+                print(row, file=sink)
+                count += 1
+            t_print = time.perf_counter() - start
+
+            start = time.perf_counter()
+            write_rows(make_rows(), sink)
+            t_batch = time.perf_counter() - start
+
+        print(f"{name}: print per row {count / t_print:,.0f} rows/s, "
+              f"buffered writer {count / t_batch:,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    benchmark()
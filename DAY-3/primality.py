@@ -0,0 +1,63 @@
+#Q2 Check prime number
+#Module : deterministic Miller–Rabin for 64-bit numbers, used by factorize.py
+
+from prime_sieve import simple_sieve #bytearray sieve, only for the cross-check (prime_sieve.py)
+
+#small primes used as a quick pre-filter before Miller–Rabin
+SMALL_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47,
+                53, 59, 61, 67, 71, 73, 79, 83, 89, 97)
+
+#these bases make Miller–Rabin exact for every n < 2**64
+MR_BASES_64 = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+
+def _miller_rabin(n):
+    """
+    Strong probable-prime test of odd n > 37 against MR_BASES_64.
+    Deterministic for n < 2**64; for bigger n it is a 12-base probable-prime test.
+    """
+    #write n - 1 as d * 2**s with d odd
+    d = n - 1
+    s = (d & -d).bit_length() - 1
+    d >>= s
+    for a in MR_BASES_64:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def is_probable_prime(n):
+    """
+    Return True if n is prime: small-prime filter, then Miller–Rabin.
+    Exact for n < 2**64. Time: O(log^3 n)
+    """
+    if n < 2:
+        return False
+    #fast path: small numbers and numbers with a small factor
+    for p in SMALL_PRIMES:
+        if n % p == 0:
+            return n == p
+    if n < SMALL_PRIMES[-1] ** 2:
+        return True
+    return _miller_rabin(n)
+
+
+def check_against_sieve(limit=200_000):
+    #must agree with the sieve of prime_sieve.py
+    assert [n for n in range(limit + 1) if is_probable_prime(n)] == simple_sieve(limit)
+    #64-bit primes and composites (a Mersenne prime, the largest 64-bit prime,
+    #2**64 - 1 and a strong pseudoprime to bases 2, 3, 5, 7)
+    samples = [2**61 - 1, 2**64 - 59, 2**64 - 1, 3215031751]
+    assert [is_probable_prime(n) for n in samples] == [True, True, False, False]
+    print(f"Miller–Rabin agrees with the sieve up to {limit}")
+
+
+if __name__ == "__main__":
+    check_against_sieve()
@@ -0,0 +1,146 @@
+#Q3 Find all prime numbers up to N
+#Module : segmented Sieve of Eratosthenes used by 3-all-prime.py
+
+import math
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+#default segment size (numbers per chunk), about 1 MB of flags -> fits in L2 cache
+SEGMENT_SIZE = 1 << 20
+
+
+def simple_sieve(limit):
+    """
+    Return the list of primes <= limit using a bytearray sieve.
+    Used for small limits and for the base primes of the segmented sieve.
+    Time: O(n log log n), Space: O(n)
+    """
+    if limit < 2:
+        return []
+    flags = bytearray([1]) * (limit + 1)
+    flags[0] = flags[1] = 0
+    for p in range(2, math.isqrt(limit) + 1):
+        if flags[p]:
+            #cross out p*p, p*p+p, ... in one slice assignment
+            flags[p * p::p] = bytes(len(range(p * p, limit + 1, p)))
+    return [i for i, is_p in enumerate(flags) if is_p]
+
+
+def sieve_segment(low, high, base_primes):
+    """
+    Return the primes in [low, high) as a NumPy int64 array.
+    base_primes must contain every prime <= sqrt(high - 1).
+    """
+    low = max(low, 2)
+    if high <= low:
+        return np.empty(0, dtype=np.int64)
+    flags = np.ones(high - low, dtype=np.bool_)
+    for p in base_primes:
+        if p * p >= high:
+            break
+        #first multiple of p inside the segment (never below p*p)
+        start = max(p * p, (low + p - 1) // p * p)
+        flags[start - low::p] = False
+    return np.flatnonzero(flags).astype(np.int64) + low
+
+
+def _segment_worker(args):
+    #top-level helper so the process pool can pickle it
+    low, high, base_primes = args
+    return sieve_segment(low, high, base_primes)
+
+
+def iter_prime_segments(limit, segment_size=SEGMENT_SIZE, processes=None):
+    """
+    Yield NumPy arrays with the primes <= limit, one array per segment, in order.
+    Only one segment (per worker) is held in memory at a time, so limits
+    up to 10**10 run in bounded memory.
+    processes: number of worker processes (None or 1 -> sieve in this process).
+    """
+    if limit < 2:
+        return
+    base_primes = simple_sieve(math.isqrt(limit))
+    bounds = ((low, min(low + segment_size, limit + 1))
+              for low in range(2, limit + 1, segment_size))
+
+    if not processes or processes == 1:
+        for low, high in bounds:
+            yield sieve_segment(low, high, base_primes)
+        return
+
+    #keep at most 2 segments per worker in flight to bound memory
+    window = processes * 2
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        pending = []
+        for low, high in bounds:
+            pending.append(pool.submit(_segment_worker, (low, high, base_primes)))
+            if len(pending) >= window:
+                yield pending.pop(0).result()
+        for future in pending:
+            yield future.result()
+
+
+def iter_primes(limit, segment_size=SEGMENT_SIZE, processes=None):
+    """
+    Yield every prime <= limit as a Python int, streaming segment by segment.
+    """
+    for segment in iter_prime_segments(limit, segment_size, processes):
+        yield from segment.tolist()
+
+
+def count_primes(limit, segment_size=SEGMENT_SIZE, processes=None):
+    """
+    Return how many primes are <= limit without keeping them in memory.
+    """
+    return sum(len(segment) for segment in iter_prime_segments(limit, segment_size, processes))
+
+
+def primes_up_to(num, segment_size=SEGMENT_SIZE, processes=None):
+    """
+    Return the list of all primes <= num (same result as the old nested loop).
+    """
+    if num <= segment_size:
+        return simple_sieve(num)
+    return list(iter_primes(num, segment_size, processes))
+
+
+def trial_division_primes(num):
+    """
+    Original approach from 3-all-prime.py, kept as reference for the benchmark.
+    Time: O(n^2)
+    """
+    Prime_numbers = []
+    for element in range(2, num + 1):
+        for i in range(2, element):
+            if element % i == 0:
+                break
+        else:
+            Prime_numbers.append(element)
+    return Prime_numbers
+
+
+def benchmark(sizes=(1_000, 5_000, 20_000)):
+    #compare the old nested loop with the sieve for a few values of N
+    print(f"{'N':>10} {'trial division (s)':>20} {'sieve (s)':>12} {'speed-up':>10}")
+    for n in sizes:
+        start = time.perf_counter()
+        expected = trial_division_primes(n)
+        t_old = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = primes_up_to(n)
+        t_new = time.perf_counter() - start
+
+        assert result == expected, f"sieve mismatch for N={n}"
+        print(f"{n:>10} {t_old:>20.4f} {t_new:>12.6f} {t_old / t_new:>9.0f}x")
+
+    #streaming count with small segments to exercise the segmented path
+    start = time.perf_counter()
+    total = count_primes(10**7, segment_size=1 << 16)
+    print(f"pi(10^7) = {total} in {time.perf_counter() - start:.3f} s (segmented)")
+
+
+if __name__ == "__main__":
+    benchmark()
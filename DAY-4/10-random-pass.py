@@ -1,18 +1,20 @@
 #Q10 Function to generate random password
 
 #importing required modules or libaries
-import random #for random choosing a element
-import string #used to create characters
+import sys
 
-#password generating function
-def generate_password(length=8):
-    characters = string.ascii_letters + string.digits + string.punctuation
-    password = ""
+from password_batch import generate_passwords #secure bulk generator (password_batch.py)
 
-    for i in range(length):
-        password += random.choice(characters)
+#password generating function (secrets.token_bytes instead of random, no string += per character)
+def generate_password(length=8):
+    return generate_passwords(1, length)[0]
 
-    return password
+#batch mode: python 10-random-pass.py <count> [length], every password has a lower, upper, digit and symbol
+if len(sys.argv) > 1:
+    length = int(sys.argv[2]) if len(sys.argv) > 2 else 12
+    policy = ("lower", "upper", "digit", "punct") if length >= 4 else None
+    sys.stdout.write("\n".join(generate_passwords(int(sys.argv[1]), length, policy=policy)) + "\n")
+    sys.exit()
 
 #taking input
 num = int(input("Enter how many digit or long password u need: "))
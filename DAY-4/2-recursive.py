@@ -1,11 +1,11 @@
 #Q2 Function to find factorial (recursive)
 
-#function for factorial
-def factorial(num):
-    if (num == 0 or num == 1):
-        return 1
-    else:
-         return num*factorial(num-1) #recursion
+#factorial from the engine module (factorial_engine.py)
+#the recursive version hit RecursionError around 1000, it is kept there as factorial_recursive
+from factorial_engine import factorial
+import sys
+
+sys.set_int_max_str_digits(0) #allow printing factorials with more than 4300 digits
 
 #taking input
 number = int(input("Enter the number: "))
@@ -1,13 +1,19 @@
 #Q3 Function to calculate power (a^b)
 
+from power_tools import int_power, powmod #power module (power_tools.py)
+
 #function to calculate power
-def power(a,b):
-    return a**b
+#optional modulus keeps huge exponents fast (a^b mod m, no giant integer built)
+def power(a,b,mod=None):
+    if mod is None:
+        return int_power(a,b) if b >= 0 else a**b
+    return powmod(a,b,mod)
 
 #input the base and power num
 base = int(input("Enter the base number: "))
 power_num = int(input("Enter the power number: "))
+modulus = input("Enter the modulus (leave empty for none): ")
 
 #storing and printing the result
-result = power(base,power_num)
+result = power(base,power_num,int(modulus) if modulus.strip() else None)
 print(result,"is the answer.")
\ No newline at end of file
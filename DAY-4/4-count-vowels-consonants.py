@@ -1,17 +1,12 @@
 #Q4 Function to count vowels and consonants
 
 #function for finding vowels and consonants
+#dict.fromkeys removes duplicates in one pass (keeps the order), so there is
+#no "not in list" scan per character (DAY-1/char_classes.py does the same for large texts)
 def vowels_consonants(str):
-    vowels = []
-    consonants = []
-    for i in str:
-        if i.isalpha():
-            if i in "aeiouAEIOU":
-                if i not in vowels: #to avoid duplicates
-                    vowels.append(i)
-            else:
-                if i not in consonants: #to avoid duplicates
-                    consonants.append(i)
+    letters = [i for i in dict.fromkeys(str) if i.isalpha()]
+    vowels = [i for i in letters if i in "aeiouAEIOU"]
+    consonants = [i for i in letters if i not in "aeiouAEIOU"]
     return vowels,consonants
 
 #taking input of string
@@ -1,10 +1,12 @@
 #Q5 Function to check string is palindrome
 
 #function for checking string is palindrome or not.
+#(first half against the reversed second half: only half the string is reversed,
+#DAY-1/palindrome.py has the block-wise version for very long texts)
 def checker(str):
     str = str.lower()
-    reversed_str = str[::-1]
-    if (reversed_str == str):
+    half = len(str) // 2
+    if (str[:half] == str[len(str) - half:][::-1]):
         print(str,"is a palindrome.") #result
     else:
         print(str,"is not a palindrome.") #result
@@ -8,7 +8,10 @@ def square(n):
     print(math.sqrt(n))
 
 def power(a,b):
-    print(math.pow(a, b)) 
+    if isinstance(a, int) and isinstance(b, int) and b >= 0:
+        print(a ** b) #exact for integers, math.pow would round to a float
+    else:
+        print(math.pow(a, b))
 
 def factorial(n):
     print(math.factorial(n)) 
\ No newline at end of file
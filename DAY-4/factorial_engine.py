@@ -0,0 +1,116 @@
+#Q2 Function to find factorial
+#Module : iterative / cached factorial (and mod / log variants) used by 2-recursive.py
+
+import math
+import time
+
+import numpy as np
+
+#factorials up to this n are kept in a prefix cache
+CACHE_LIMIT = 1000
+
+_prefix = [1] #_prefix[i] == i!
+
+
+def factorial(n):
+    """
+    Return n! for an integer n >= 0.
+    Small n are served from a prefix cache; large n go to math.factorial,
+    which already multiplies by binary splitting in C.
+    No recursion, so no RecursionError for big n.
+    """
+    if n < 0:
+        raise ValueError("factorial() not defined for negative values")
+    if n <= CACHE_LIMIT:
+        #extend the cache only as far as needed
+        while len(_prefix) <= n:
+            _prefix.append(_prefix[-1] * len(_prefix))
+        return _prefix[n]
+    return math.factorial(n)
+
+
+def factorial_mod(n, p):
+    """
+    Return n! mod p without building n!.
+    If n >= p then p itself is one of the factors, so the answer is 0.
+    """
+    if n < 0:
+        raise ValueError("factorial() not defined for negative values")
+    if p <= 0:
+        raise ValueError("p must be > 0")
+    if n >= p:
+        return 0
+    result = 1 % p
+    for i in range(2, n + 1):
+        result = result * i % p
+    return result
+
+
+def log_factorial(values):
+    """
+    Return ln(n!) for every n in values as a float64 NumPy array.
+    Integer inputs up to 10**7 use a cumulative sum of logs, the rest use lgamma(n + 1).
+    """
+    arr = np.asarray(values)
+    if np.any(arr < 0):
+        raise ValueError("factorial() not defined for negative values")
+    if arr.size == 0:
+        return np.empty(arr.shape, dtype=np.float64)
+    if arr.dtype.kind in "iu" and arr.max() <= 10**7:
+        #table[k] == ln(k!)
+        table = np.concatenate(([0.0], np.cumsum(np.log(np.arange(1, int(arr.max()) + 1)))))
+        return table[arr]
+    lgamma = np.frompyfunc(math.lgamma, 1, 1)
+    return lgamma(arr.astype(np.float64) + 1).astype(np.float64)
+
+
+def factorial_recursive(num):
+    """
+    Original recursive version from 2-recursive.py, kept as reference.
+    """
+    if (num == 0 or num == 1):
+        return 1
+    else:
+        return num*factorial_recursive(num-1)
+
+
+def check_against_math():
+    #every implementation must agree with math.factorial (used by mymodule.factorial)
+    for n in list(range(0, 1200)) + [5_000, 20_000]:
+        assert factorial(n) == math.factorial(n), n
+    for n in range(0, 900):
+        assert factorial_recursive(n) == math.factorial(n), n
+    #each n! is computed once and reduced for every modulus
+    for n in (0, 1, 5, 96, 500, 10**5):
+        exact = math.factorial(n)
+        for p in (2, 7, 97, 10**9 + 7, 1_000_000):
+            assert factorial_mod(n, p) == exact % p, (n, p)
+    ns = np.arange(0, 3000)
+    expected = np.array([math.lgamma(n + 1) for n in ns])
+    assert np.allclose(log_factorial(ns), expected)
+    assert np.allclose(log_factorial(ns.astype(float)), expected)
+    print("all factorial checks agree with math.factorial")
+
+
+def benchmark():
+    #recursive version vs engine (cached path); large n is math.factorial itself
+    for n in (500, 900):
+        start = time.perf_counter()
+        for _ in range(100):
+            factorial_recursive(n)
+        t_old = time.perf_counter() - start
+        start = time.perf_counter()
+        for _ in range(100):
+            factorial(n)
+        t_new = time.perf_counter() - start
+        print(f"n={n:>7}: 100 calls recursive {t_old:.4f} s, cached {t_new:.6f} s")
+
+    arr = np.random.default_rng(0).integers(0, 10**6, size=10**6)
+    start = time.perf_counter()
+    log_factorial(arr)
+    print(f"log_factorial over 10^6 values in {time.perf_counter() - start:.4f} s")
+
+
+if __name__ == "__main__":
+    check_against_math()
+    benchmark()
@@ -0,0 +1,153 @@
+#Q10 Function to generate random password
+#Module : secure bulk password generation used by 10-random-pass.py
+
+import random
+import secrets
+import string
+import time
+
+import numpy as np
+
+ALPHABET = string.ascii_letters + string.digits + string.punctuation
+
+CLASSES = {
+    "lower": string.ascii_lowercase,
+    "upper": string.ascii_uppercase,
+    "digit": string.digits,
+    "punct": string.punctuation,
+}
+
+
+def _codes(chars):
+    #ASCII characters as a uint8 array
+    if not chars or not chars.isascii() or len(set(chars)) != len(chars):
+        raise ValueError("the alphabet must be non-empty, ASCII only and without repeated characters")
+    return np.frombuffer(chars.encode("ascii"), dtype=np.uint8)
+
+
+def secure_indices(count, size):
+    """
+    Return count uniform random integers in range(size) (size <= 256) as a uint8 array.
+    Bytes come from secrets.token_bytes in bulk; bytes >= the largest multiple
+    of size are rejected, so byte % size has no modulo bias.
+    """
+    if not 0 < size <= 256:
+        raise ValueError("size must be between 1 and 256")
+    limit = 256 - 256 % size
+    out = np.empty(count, dtype=np.uint8)
+    filled = 0
+    while filled < count:
+        need = count - filled
+        #ask for enough bytes that one round almost always suffices
+        raw = np.frombuffer(secrets.token_bytes(need * 256 // limit + 64), dtype=np.uint8)
+        raw = raw[raw < limit][:need]
+        out[filled:filled + len(raw)] = raw % size
+        filled += len(raw)
+    return out
+
+
+def _policy_counts(policy, alphabet):
+    #{class name: minimum count} with the class characters limited to the alphabet
+    if policy is None:
+        return {}
+    if not isinstance(policy, dict):
+        policy = dict.fromkeys(policy, 1)
+    counts = {}
+    for name, minimum in policy.items():
+        if name not in CLASSES:
+            raise ValueError(f"unknown character class {name!r}, choose from {sorted(CLASSES)}")
+        chars = "".join(c for c in CLASSES[name] if c in alphabet)
+        if minimum > 0 and not chars:
+            raise ValueError(f"the alphabet has no {name} characters")
+        if minimum > 0:
+            counts[chars] = minimum
+    return counts
+
+
+def generate_passwords(n, length=12, alphabet=ALPHABET, policy=None):
+    """
+    Return a list of n passwords of the given length, drawn uniformly from alphabet
+    with cryptographically secure randomness (secrets.token_bytes).
+    policy: class names ("lower", "upper", "digit", "punct") that must each appear
+    at least once, or a dict {class: minimum count}. The policy is met by
+    construction: every password gets randomly placed slots that are filled
+    from the required classes, so no password is ever regenerated.
+    """
+    codes = _codes(alphabet)
+    required = _policy_counts(policy, alphabet)
+    if sum(required.values()) > length:
+        raise ValueError(f"the policy needs {sum(required.values())} characters, more than length {length}")
+    if n <= 0 or length <= 0:
+        return [""] * max(n, 0)
+
+    passwords = codes[secure_indices(n * length, len(codes))].reshape(n, length)
+    if required:
+        #a secure random order of the positions of each password; the first
+        #slots of that order are given to the required classes
+        keys = np.frombuffer(secrets.token_bytes(8 * n * length), dtype=np.uint64).reshape(n, length)
+        order = keys.argsort(axis=1)
+        rows = np.arange(n)[:, None]
+        slot = 0
+        for chars, minimum in required.items():
+            class_codes = _codes(chars)
+            picks = class_codes[secure_indices(n * minimum, len(class_codes))].reshape(n, minimum)
+            passwords[rows, order[:, slot:slot + minimum]] = picks
+            slot += minimum
+
+    text = passwords.tobytes().decode("ascii")
+    return [text[i:i + length] for i in range(0, n * length, length)]
+
+
+def generate_password(length=8, alphabet=ALPHABET, policy=None):
+    """
+    Return one secure password (see generate_passwords).
+    """
+    return generate_passwords(1, length, alphabet, policy)[0]
+
+
+def _generate_password_loop(length=8):
+    #original approach from 10-random-pass.py (random module, string concatenation)
+    characters = ALPHABET
+    password = ""
+    for i in range(length):
+        password += random.choice(characters)
+    return password
+
+
+def benchmark(n=200_000, length=16):
+    #random.choice loop vs secrets.choice loop vs bulk bytes, in passwords per second
+    start = time.perf_counter()
+    for _ in range(n):
+        _generate_password_loop(length)
+    t_loop = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(n):
+        "".join(secrets.choice(ALPHABET) for _ in range(length))
+    t_secrets = time.perf_counter() - start
+
+    start = time.perf_counter()
+    passwords = generate_passwords(n, length)
+    t_batch = time.perf_counter() - start
+
+    policy = ("lower", "upper", "digit", "punct")
+    start = time.perf_counter()
+    with_policy = generate_passwords(n, length, policy=policy)
+    t_policy = time.perf_counter() - start
+
+    assert len(passwords) == len(with_policy) == n
+    assert all(len(p) == length and set(p) <= set(ALPHABET) for p in passwords)
+    for name in policy:
+        assert all(any(c in CLASSES[name] for c in p) for p in with_policy), name
+    #every character should show up about equally often
+    counts = np.bincount(np.frombuffer("".join(passwords).encode(), dtype=np.uint8), minlength=128)
+    counts = counts[_codes(ALPHABET)]
+    assert counts.min() > 0.9 * counts.mean() and counts.max() < 1.1 * counts.mean()
+
+    print(f"{n} passwords of {length}: random.choice loop {n / t_loop:,.0f}/s, "
+          f"secrets.choice loop {n / t_secrets:,.0f}/s, bulk token_bytes {n / t_batch:,.0f}/s, "
+          f"with 4-class policy {n / t_policy:,.0f}/s")
+
+
+if __name__ == "__main__":
+    benchmark()
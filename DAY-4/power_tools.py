@@ -0,0 +1,107 @@
+#Q3 Function to calculate power (a^b)
+#Module : exact / modular / vectorised power used by 3-calculate-power.py
+
+import math
+import time
+
+import numpy as np
+
+#floats represent every integer below 2**53 exactly
+_FLOAT_EXACT_BITS = 53
+
+
+def powmod(a, b, m):
+    """
+    Return a**b mod m using three-argument pow (square-and-multiply, O(log b)).
+    A negative exponent uses the modular inverse of a, which must exist.
+    """
+    if m == 0:
+        raise ValueError("modulus must be non-zero")
+    if b < 0 and math.gcd(a, m) != 1:
+        raise ValueError(f"{a} has no inverse modulo {m}")
+    return pow(a, b, m)
+
+
+def int_power(a, b):
+    """
+    Return a**b exactly for integers a and b >= 0.
+    math.pow is used only when the result is small enough to be exact as a float.
+    """
+    if b < 0:
+        raise ValueError("use powmod or float division for negative exponents")
+    if a == 0 or b == 0:
+        return 0 if b else 1
+    #|a|**b < 2**(bits*b), so this bound guarantees an exact float result
+    if abs(a).bit_length() * b <= _FLOAT_EXACT_BITS:
+        return int(math.pow(a, b))
+    return a ** b
+
+
+def _powmod_array(bases, exps, mod):
+    #vectorised square-and-multiply, all arrays uint64 and mod < 2**32
+    result = np.ones_like(bases)
+    bases = bases % mod
+    exps = exps.copy()
+    while exps.any():
+        odd = (exps & 1).astype(bool)
+        result[odd] = result[odd] * bases[odd] % mod
+        bases = bases * bases % mod
+        exps >>= 1
+    return result % mod
+
+
+def power_many(bases, exps, mod=None):
+    """
+    Return bases[i] ** exps[i] (or mod `mod`) for every pair, as a NumPy array.
+    With mod < 2**32 the whole batch runs as uint64 square-and-multiply.
+    Without mod, int64 results are used when they cannot overflow,
+    otherwise an object array of exact Python ints is returned.
+    """
+    bases, exps = np.broadcast_arrays(np.asarray(bases), np.asarray(exps))
+    if exps.size and exps.min() < 0:
+        raise ValueError("exponents must be >= 0")
+
+    if mod is not None:
+        if bases.dtype.kind in "iu" and 0 < mod < 2**32:
+            return _powmod_array(np.mod(bases, mod).astype(np.uint64),
+                                 exps.astype(np.uint64), np.uint64(mod)).astype(np.int64)
+        return np.array([powmod(int(a), int(b), mod) for a, b in zip(bases.ravel(), exps.ravel())],
+                        dtype=object).reshape(bases.shape)
+
+    if bases.dtype.kind == "f":
+        return np.power(bases, exps)
+    #bits needed by the largest result: bit_length(|base|) * exp must stay below 63
+    bits = np.ceil(np.log2(np.abs(bases.astype(np.float64)) + 1)) * exps
+    if bits.size == 0 or bits.max() < 63:
+        return np.power(bases.astype(np.int64), exps.astype(np.int64))
+    return np.array([int_power(int(a), int(b)) for a, b in zip(bases.ravel(), exps.ravel())],
+                    dtype=object).reshape(bases.shape)
+
+
+def benchmark(n=200_000):
+    #bulk modular powers: Python loop with pow() vs power_many
+    rng = np.random.default_rng(0)
+    bases = rng.integers(0, 10**9, size=n)
+    exps = rng.integers(0, 10**6, size=n)
+    mod = 1_000_000_007
+
+    start = time.perf_counter()
+    expected = [pow(int(a), int(b), mod) for a, b in zip(bases, exps)]
+    t_loop = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = power_many(bases, exps, mod)
+    t_vec = time.perf_counter() - start
+
+    assert result.tolist() == expected
+    print(f"{n} modular powers: loop {t_loop:.3f} s, power_many {t_vec:.3f} s")
+
+    start = time.perf_counter()
+    for b in range(1, 50):
+        assert int_power(3, b) == 3 ** b
+    powmod(3, 10**7, mod)
+    print(f"3^(10^7) mod p = {powmod(3, 10**7, mod)} in {time.perf_counter() - start:.6f} s")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -1,5 +1,10 @@
 # Q1 Convert string to uppercase/lowercase
 
+from normalize import Normalizer #normalisation pipeline module (normalize.py)
+
+upper = Normalizer(case="upper")
+lower = Normalizer(case="lower")
+
 #taking input
 name = input("Enter the string: ")
 
@@ -8,9 +13,9 @@ type = input("Choose string to be converted into up:uppercase or low:lowercase :
 
 #converting the string
 if type == "up" or type == "uppercase":
-    print(name.upper())
+    print(upper(name))
 elif type == "low" or type == "lowercase":
-    print(name.lower())
+    print(lower(name))
 else:
-    print("lowercase:",name.lower())
-    print("uppercase:",name.upper())
+    print("lowercase:",lower(name))
+    print("uppercase:",upper(name))
@@ -1,14 +1,16 @@
 # Q10 Reverse words in a sentence
 
-#input
-sentance = list(input("Input: ").split())
+import sys
+
+from word_reverse import reverse_words, reverse_file #word reversal module (word_reverse.py)
 
-#reversed words
-reversed_words = []
+#file mode: python 10-words-reverse-in-sentence.py <input> [output], streamed block by block
+if len(sys.argv) > 1:
+    reverse_file(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else "-")
+    sys.exit()
 
-#reversing the words from sentence
-for i in sentance:
-    reversed_words.append(i[::-1])
+#input
+sentance = input("Input: ")
 
-#joining the words and making a sentance with proper seperator
-print(" ".join(reversed_words))
\ No newline at end of file
+#reversing every word in place, the word order stays the same
+print(reverse_words(" ".join(sentance.split())))
\ No newline at end of file
@@ -1,15 +1,13 @@
 # Q2 Count occurrences of character in string
 
+from char_frequency import char_counts #character frequency module (char_frequency.py)
+
 #input from user
 string1 = str(input("Enter the sstring: "))
-lower = string1.lower()
 
-counted_list = []
-#counting frequency each character
+#counting frequency each character in one pass (no lower.count per character)
+counts = char_counts(string1, ignore_case=True)
+
 print("Frequency of each character: ") 
-for i in lower :
-    if i in counted_list:
-        continue
-    else:
-        print(i,":",lower.count(i))
-        counted_list.append(i)
\ No newline at end of file
+for i, count in counts.items():
+    print(i,":",count)
\ No newline at end of file
@@ -1,10 +1,24 @@
 # Q3 Replace all spaces with underscores
 
+import sys
+
+from normalize import Normalizer, normalize_file #normalisation pipeline module (normalize.py)
+
+underscores = Normalizer(replace_spaces="_")
+
+#file mode: python 3-Replace-spaces.py <input> [output] [processes], streamed in blocks of lines
+if len(sys.argv) > 1:
+    output = sys.argv[2] if len(sys.argv) > 2 else "-"
+    processes = int(sys.argv[3]) if len(sys.argv) > 3 else None
+    lines, seconds, rate = normalize_file(underscores, sys.argv[1], output, processes)
+    print(f"{lines} lines in {seconds:.2f} s ({rate:,.0f} lines/s)", file=sys.stderr)
+    sys.exit()
+
 #input
 sentance = input("Enter the sentence: ")
 
 #replacing all spaces with underscores
-new_sentance = sentance.replace(" ","_")
+new_sentance = underscores(sentance)
 
 #printing the result
 print(new_sentance)
\ No newline at end of file
@@ -1,9 +1,11 @@
 # Q7 Remove leading/trailing whitespace
 
+from normalize import Normalizer #normalisation pipeline module (normalize.py)
+
 text = input("Enter the text: ")
-clean_text = text.strip() # removes space/whitespaces from both ends
-left = text.lstrip()   # removes space/whitespaces from left end
-right = text.rstrip()   # removes space/whitespaces from right end
+clean_text = Normalizer(strip="both")(text) # removes space/whitespaces from both ends
+left = Normalizer(strip="left")(text) # removes space/whitespaces from left end
+right = Normalizer(strip="right")(text) # removes space/whitespaces from right end
 
 #printing results
 print(clean_text)
@@ -1,8 +1,13 @@
 # Q9 Check if string contains only digits
 
+from string_types import classify #vectorised string-type checks (string_types.py)
+
 #function for checking whether it is digits only or not
+#(one string -> bool, a list / NumPy array / pandas Series -> boolean mask)
 def digits_check(str):
-    return str.isdigit()
+    if isinstance(str, type("")):
+        return str.isdigit()
+    return classify(str, ("isdigit",))["isdigit"]
 
 #input
 string1 = input("Enter your numberic password: ")
@@ -0,0 +1,150 @@
+#Q2 Count occurrences of character in string
+#Module : one-pass character frequency for strings and (large) files
+
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+#bytes read per chunk when streaming a file
+CHUNK_SIZE = 1 << 23
+
+#below this length Counter is faster than building a NumPy array
+_BINCOUNT_MIN_LENGTH = 1 << 16
+
+
+def _count_bytes(data):
+    #Counter of characters for pure-ASCII bytes via one np.bincount
+    hist = np.bincount(np.frombuffer(data, dtype=np.uint8), minlength=256)
+    return Counter({chr(b): int(hist[b]) for b in np.flatnonzero(hist)})
+
+
+def char_counts(text, ignore_case=False):
+    """
+    Return a Counter {character: count} of text in one pass.
+    Long ASCII strings are counted with np.bincount over their bytes,
+    everything else with collections.Counter (which keeps first-seen order).
+    """
+    if ignore_case:
+        text = text.lower()
+    if len(text) >= _BINCOUNT_MIN_LENGTH and text.isascii():
+        return _count_bytes(text.encode("ascii"))
+    return Counter(text)
+
+
+def _count_chunk(data, ignore_case):
+    if ignore_case:
+        data = data.lower() #bytes.lower only changes ASCII letters
+    if data.isascii():
+        return _count_bytes(data)
+    text = data.decode("utf-8", errors="replace")
+    return Counter(text.lower() if ignore_case else text)
+
+
+def _align(f, pos, size):
+    #move pos forward past UTF-8 continuation bytes so no character is split
+    while 0 < pos < size:
+        f.seek(pos)
+        if f.read(1)[0] & 0xC0 != 0x80:
+            break
+        pos += 1
+    return pos
+
+
+def _count_range(args):
+    #worker: count the characters that start in [start, end) of the file
+    path, start, end, ignore_case, chunk_size = args
+    counts = Counter()
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        start, end = _align(f, start, size), _align(f, end, size)
+        f.seek(start)
+        pos = start
+        while pos < end:
+            data = f.read(min(chunk_size, end - pos))
+            pos += len(data)
+            #finish a character cut by the chunk limit
+            while pos < end and data and f.peek(1)[:1] and f.peek(1)[0] & 0xC0 == 0x80:
+                data += f.read(1)
+                pos += 1
+            counts.update(_count_chunk(data, ignore_case))
+    return counts
+
+
+def count_file(path, ignore_case=False, processes=None, chunk_size=CHUNK_SIZE):
+    """
+    Return a Counter of the characters of a UTF-8 file, streamed chunk by chunk.
+    With processes > 1 the file is split into byte ranges (aligned to character
+    starts), each worker counts its range and the Counters are merged.
+    """
+    size = os.path.getsize(path)
+    if not processes or processes == 1:
+        return _count_range((path, 0, size, ignore_case, chunk_size))
+    step = max(-(-size // processes), 1)
+    jobs = [(path, low, min(low + step, size), ignore_case, chunk_size) for low in range(0, size, step)]
+    total = Counter()
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        for partial in pool.map(_count_range, jobs):
+            total.update(partial)
+    return total
+
+
+def top_chars(counts, k):
+    """
+    Return the k most common (character, count) pairs.
+    """
+    return counts.most_common(k)
+
+
+def _count_with_scans(lower):
+    #original approach from 2-Count-character-string.py (lower.count per character)
+    counted_list = []
+    result = {}
+    for i in lower:
+        if i not in counted_list:
+            result[i] = lower.count(i)
+            counted_list.append(i)
+    return result
+
+
+def benchmark(size=5_000_000, path="char_frequency_bench.txt"):
+    #per-character str.count vs Counter vs bincount, then a file with a process pool
+    rng = np.random.default_rng(0)
+    alphabet = np.frombuffer(b"abcdefghijklmnopqrstuvwxyz ABCDEFGHIJ0123456789.,!?\n", dtype=np.uint8)
+    text = rng.choice(alphabet, size=size).tobytes().decode()
+
+    start = time.perf_counter()
+    expected = _count_with_scans(text.lower())
+    t_scan = time.perf_counter() - start
+
+    start = time.perf_counter()
+    counter = Counter(text.lower())
+    t_counter = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = char_counts(text, ignore_case=True)
+    t_bincount = time.perf_counter() - start
+
+    assert dict(result) == expected == dict(counter)
+    mb = size / 2**20
+    print(f"{mb:.0f} MB string: count per char {mb / t_scan:.0f} MB/s, Counter {mb / t_counter:.0f} MB/s, "
+          f"bincount {mb / t_bincount:.0f} MB/s")
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text + "héllo wörld ✓\n" * 1000)
+    try:
+        for processes in (1, 4):
+            start = time.perf_counter()
+            counts = count_file(path, processes=processes, chunk_size=1 << 20)
+            elapsed = time.perf_counter() - start
+            print(f"file, {processes} process(es): {mb / elapsed:.0f} MB/s, top 3 {top_chars(counts, 3)}")
+        with open(path, encoding="utf-8") as f:
+            assert counts == Counter(f.read())
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    benchmark()
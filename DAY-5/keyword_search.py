@@ -0,0 +1,228 @@
+#Q4 / Q8 Find substrings in a string
+#Module : Aho-Corasick multi-keyword search over large texts (one keyword is faster with str.find / startswith)
+
+import os
+import pickle
+import random
+import string
+import time
+from collections import deque
+
+#characters read per chunk when searching a file
+CHUNK_SIZE = 1 << 20
+
+
+def _case_variants(c):
+    #single-character spellings of c in other cases ("a" -> "a", "A")
+    variants = {c}
+    for other in (c.lower(), c.upper(), c.title()):
+        if len(other) == 1:
+            variants.add(other)
+    return variants
+
+
+class AhoCorasick:
+    """
+    Aho-Corasick automaton over a fixed list of keywords.
+    Built once (trie + failure links), it finds every occurrence of every
+    keyword in one pass over the text, following the failure links on the fly
+    (amortised O(1) per character), whatever the number of keywords.
+    With ignore_case the keywords are lowered and every trie edge is also
+    added for the other cases of its character, so the text itself is never
+    lowered or copied. Automata can be pickled (save / load) for fast reuse.
+    """
+
+    def __init__(self, keywords, ignore_case=False):
+        self.ignore_case = ignore_case
+        #keep the first spelling of duplicate keywords, drop empty ones
+        keys = (k.lower() if ignore_case else k for k in keywords)
+        self.keywords = [k for k in dict.fromkeys(keys) if k]
+        self._lengths = [len(k) for k in self.keywords]
+        self._build()
+
+    def _build(self):
+        #trie
+        goto = [{}]
+        outputs = [[]]
+        for index, keyword in enumerate(self.keywords):
+            node = 0
+            for c in keyword:
+                child = goto[node].get(c)
+                if child is None:
+                    child = len(goto)
+                    goto.append({})
+                    outputs.append([])
+                    goto[node][c] = child
+                node = child
+            outputs[node].append(index)
+
+        #breadth-first: failure links and merged outputs. No transition table is
+        #built (a full one copies the failure state's row into every state);
+        #the scan follows goto / fail on the fly, amortised O(1) per character.
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            outputs[node].extend(outputs[fail[node]])
+            for c, child in goto[node].items():
+                if node:
+                    state = fail[node]
+                    while state and c not in goto[state]:
+                        state = fail[state]
+                    fail[child] = goto[state].get(c, 0)
+                queue.append(child)
+
+        if self.ignore_case:
+            #the other-case spellings of each distinct character, worked out once;
+            #they lead to the same child as the lower-case edge
+            variants = {c: tuple(_case_variants(c) - {c}) for c in set().union(*goto)}
+            for row in goto:
+                extra = {v: child for c, child in row.items() for v in variants[c] if v not in row}
+                row.update(extra)
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = [tuple(out) for out in outputs]
+
+    def __len__(self):
+        return len(self.keywords)
+
+    def __repr__(self):
+        return f"AhoCorasick({len(self.keywords)} keywords, {len(self._goto)} states, ignore_case={self.ignore_case})"
+
+    def _scan(self, chunks):
+        #one pass over consecutive chunks of text; the state is carried across
+        #chunk borders so a keyword split between two chunks is still found
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+        lengths = self._lengths
+        keywords = self.keywords
+        node = 0
+        offset = 0
+        for chunk in chunks:
+            for end, c in enumerate(chunk, offset + 1):
+                child = goto[node].get(c)
+                while child is None and node:
+                    node = fail[node]
+                    child = goto[node].get(c)
+                node = child or 0
+                if outputs[node]:
+                    for index in outputs[node]:
+                        yield end - lengths[index], keywords[index]
+            offset += len(chunk)
+
+    def iter_matches(self, text):
+        """
+        Yield (start, keyword) for every occurrence in text, ordered by end position.
+        """
+        return self._scan((text,))
+
+    def find_all(self, text):
+        """
+        Return {keyword: [start positions]} for the keywords found in text.
+        """
+        found = {}
+        for start, keyword in self.iter_matches(text):
+            found.setdefault(keyword, []).append(start)
+        return found
+
+    def search_file(self, path, chunk_size=CHUNK_SIZE):
+        """
+        Yield (start, keyword) for every occurrence in a UTF-8 file (character
+        positions), streamed chunk by chunk.
+        """
+        with open(path, encoding="utf-8") as f:
+            yield from self._scan(iter(lambda: f.read(chunk_size), ""))
+
+    def save(self, path):
+        """
+        Pickle the built automaton to path.
+        """
+        with open(path, "wb") as f:
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def load(path):
+        """
+        Load an automaton written by save.
+        """
+        with open(path, "rb") as f:
+            automaton = pickle.load(f)
+        if not isinstance(automaton, AhoCorasick) or not hasattr(automaton, "_goto"):
+            raise TypeError(f"{path} does not contain an AhoCorasick automaton of this version")
+        return automaton
+
+
+def load_or_build(keywords, path, ignore_case=False):
+    """
+    Return the automaton pickled at path if it was built from the same keywords
+    (and case mode); otherwise build it and pickle it there for the next run.
+    """
+    keywords = list(keywords)
+    if os.path.exists(path):
+        try:
+            automaton = AhoCorasick.load(path)
+        except TypeError:
+            automaton = None #written by an older version: rebuild it
+        expected = [k for k in dict.fromkeys(k.lower() if ignore_case else k for k in keywords) if k]
+        if automaton is not None and automaton.ignore_case == ignore_case and automaton.keywords == expected:
+            return automaton
+    automaton = AhoCorasick(keywords, ignore_case)
+    automaton.save(path)
+    return automaton
+
+
+def find_all_by_scan(text, keywords):
+    #reference approach: one str.find loop per keyword
+    found = {}
+    for keyword in keywords:
+        start = text.find(keyword)
+        while start != -1:
+            found.setdefault(keyword, []).append(start)
+            start = text.find(keyword, start + 1)
+    return found
+
+
+def benchmark(n_keywords=2000, size=2_000_000, path="keyword_search_bench.pkl"):
+    #str.find loop per keyword vs one Aho-Corasick pass, plus build vs pickle reload
+    rng = random.Random(0)
+    letters = string.ascii_lowercase[:12]
+    keywords = list(dict.fromkeys("".join(rng.choices(letters, k=rng.randint(4, 8))) for _ in range(n_keywords)))
+    text = "".join(rng.choices(letters + " ", k=size))
+
+    start = time.perf_counter()
+    expected = find_all_by_scan(text, keywords)
+    t_scan = time.perf_counter() - start
+
+    try:
+        if os.path.exists(path):
+            os.remove(path)
+        start = time.perf_counter()
+        automaton = load_or_build(keywords, path)
+        t_build = time.perf_counter() - start
+        start = time.perf_counter()
+        automaton = load_or_build(keywords, path)
+        t_load = time.perf_counter() - start
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
+
+    start = time.perf_counter()
+    result = automaton.find_all(text)
+    t_ac = time.perf_counter() - start
+
+    assert result == expected
+    print(automaton)
+    print(f"{len(keywords)} keywords, {size} chars: str.find per keyword {t_scan:.2f} s, "
+          f"Aho-Corasick {t_ac:.2f} s ({sum(map(len, result.values()))} matches)")
+    print(f"build + pickle {t_build:.3f} s, reload from pickle {t_load:.3f} s")
+
+    #case-insensitive: same matches on an upper-cased text, without lowering it
+    upper = text.upper()
+    folded = AhoCorasick(keywords, ignore_case=True)
+    assert folded.find_all(upper) == expected
+
+
+if __name__ == "__main__":
+    benchmark()
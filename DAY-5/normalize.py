@@ -0,0 +1,186 @@
+#Q1 / Q3 / Q7 Case conversion, space replacement, whitespace stripping
+#Module : fused string normalisation for lines and large files
+#Used by 1-Convert-uppercase-lowercase.py, 3-Replace-spaces.py and 7-remove-leading-trailing.py
+
+import os
+import string
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+#characters per block handed to a worker (whole lines only)
+BLOCK_CHARS = 1 << 20
+
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+_ASCII_UPPER = str.maketrans(string.ascii_lowercase, string.ascii_uppercase)
+
+_STRIP = {None: None, "both": str.strip, "left": str.lstrip, "right": str.rstrip}
+
+
+class Normalizer:
+    """
+    A normalisation pipeline applied to every line in one fused pass:
+      case: None, "lower" or "upper"
+      strip: None, "both", "left" or "right" (remove whitespace at the ends)
+      collapse: turn every run of whitespace into one space (also strips both ends)
+      replace_spaces: put this string in place of every space, e.g. "_"
+    Whitespace is handled first, then case and space replacement are done
+    together by a single str.translate table (ASCII text) or lower/upper +
+    translate (other text). A Normalizer can be called on one line or on a
+    block of many lines.
+    """
+
+    def __init__(self, case=None, strip=None, collapse=False, replace_spaces=None):
+        if case not in (None, "lower", "upper"):
+            raise ValueError(f"case must be None, 'lower' or 'upper', not {case!r}")
+        if strip not in _STRIP:
+            raise ValueError(f"strip must be None, 'both', 'left' or 'right', not {strip!r}")
+        self.case = case
+        self.strip = strip
+        self.collapse = collapse
+        self.replace_spaces = replace_spaces
+
+        spaces = {ord(" "): replace_spaces} if replace_spaces is not None else {}
+        #ASCII text: case mapping and space replacement in the same table
+        ascii_case = {"lower": _ASCII_LOWER, "upper": _ASCII_UPPER}.get(case, {})
+        self._ascii_table = {**ascii_case, **spaces} or None
+        self._space_table = spaces or None
+
+    def __repr__(self):
+        return (f"Normalizer(case={self.case!r}, strip={self.strip!r}, "
+                f"collapse={self.collapse!r}, replace_spaces={self.replace_spaces!r})")
+
+    def _whitespace(self, text):
+        #per-line whitespace steps; one split of the block, one join
+        if self.collapse:
+            if "\n" not in text:
+                return " ".join(text.split())
+            return "\n".join([" ".join(line.split()) for line in text.split("\n")])
+        strip = _STRIP[self.strip]
+        if strip is None:
+            return text
+        if "\n" not in text:
+            return strip(text)
+        #every line of the block is stripped on its own
+        return "\n".join([strip(line) for line in text.split("\n")])
+
+    def __call__(self, text):
+        """
+        Return the normalised text (a single line or a block of lines).
+        """
+        text = self._whitespace(text)
+        if text.isascii():
+            return text.translate(self._ascii_table) if self._ascii_table else text
+        if self.case == "lower":
+            text = text.lower()
+        elif self.case == "upper":
+            text = text.upper()
+        return text.translate(self._space_table) if self._space_table else text
+
+    def lines(self, lines):
+        """
+        Yield every line of an iterable normalised (line endings are dropped).
+        """
+        for line in lines:
+            yield self(line.rstrip("\n"))
+
+
+def _normalize_block(args):
+    #worker: normalise one block of whole lines
+    normalizer, block = args
+    return normalizer(block)
+
+
+def _iter_blocks(f, block_chars):
+    #whole lines, about block_chars characters at a time, without the last newline
+    while True:
+        lines = f.readlines(block_chars)
+        if not lines:
+            return
+        block = "".join(lines)
+        yield block[:-1] if block.endswith("\n") else block
+
+
+def normalize_file(normalizer, src, dst, processes=None, block_chars=BLOCK_CHARS):
+    """
+    Normalise every line of the text file src into dst ("-" for stdin/stdout),
+    streamed in blocks of whole lines. With processes > 1 the blocks are
+    normalised by a process pool (results are written back in order).
+    Returns (lines, seconds, lines per second).
+    """
+    start = time.perf_counter()
+    fin = sys.stdin if src == "-" else open(src, encoding="utf-8")
+    fout = sys.stdout if dst == "-" else open(dst, "w", encoding="utf-8")
+    lines = 0
+    try:
+        blocks = _iter_blocks(fin, block_chars)
+        if not processes or processes == 1:
+            results = map(normalizer, blocks)
+        else:
+            results = _pool_map(normalizer, blocks, processes)
+        for result in results:
+            fout.write(result)
+            fout.write("\n")
+            lines += result.count("\n") + 1
+    finally:
+        if src != "-":
+            fin.close()
+        if dst != "-":
+            fout.close()
+        else:
+            fout.flush()
+    seconds = time.perf_counter() - start
+    return lines, seconds, lines / seconds if seconds else 0.0
+
+
+def _pool_map(normalizer, blocks, processes):
+    #keep at most 2 blocks per worker in flight to bound memory
+    window = processes * 2
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        pending = []
+        for block in blocks:
+            pending.append(pool.submit(_normalize_block, (normalizer, block)))
+            if len(pending) >= window:
+                yield pending.pop(0).result()
+        for future in pending:
+            yield future.result()
+
+
+def _normalize_steps(line):
+    #original approach: one full pass (and one new string) per step
+    line = line.lower()
+    line = " ".join(line.split())
+    line = line.replace(" ", "_")
+    return line
+
+
+def benchmark(n_lines=1_000_000, path="normalize_bench.txt", out_path="normalize_bench_out.txt"):
+    #separate steps per line vs fused blocks vs process pool, in lines per second
+    line = "  Hello World   from\tPython  Beginner To  Advance  "
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(n_lines):
+            f.write(f"{line}{i}  \n")
+    normalizer = Normalizer(case="lower", collapse=True, replace_spaces="_")
+    try:
+        start = time.perf_counter()
+        with open(path, encoding="utf-8") as f, open(out_path, "w", encoding="utf-8") as out:
+            for text in f:
+                out.write(_normalize_steps(text) + "\n")
+        t_steps = time.perf_counter() - start
+        with open(out_path, encoding="utf-8") as f:
+            expected = f.read()
+        print(f"{n_lines} lines, one pass per step: {n_lines / t_steps:,.0f} lines/s")
+
+        for processes in (1, 4):
+            lines, seconds, rate = normalize_file(normalizer, path, out_path, processes=processes)
+            with open(out_path, encoding="utf-8") as f:
+                assert f.read() == expected and lines == n_lines
+            print(f"{n_lines} lines, fused blocks, {processes} process(es): {rate:,.0f} lines/s")
+    finally:
+        for p in (path, out_path):
+            if os.path.exists(p):
+                os.remove(p)
+
+
+if __name__ == "__main__":
+    benchmark()
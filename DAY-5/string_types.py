@@ -0,0 +1,147 @@
+#Q9 Check if string contains only digits
+#Module : vectorised string-type checks (isdigit, isalpha, isalnum, isspace, isupper) for whole columns
+
+import time
+
+import numpy as np
+import pandas as pd
+
+CHECKS = ("isdigit", "isalpha", "isalnum", "isspace", "isupper")
+
+#rows classified per step on the ASCII path (bounds the temporary byte matrix)
+CHUNK_ROWS = 1 << 16
+
+#one bit per ASCII character class
+_DIGIT, _UPPER, _LOWER, _SPACE, _OTHER = 1, 2, 4, 8, 16
+
+_CLASS = np.full(256, _OTHER, dtype=np.uint8)
+_CLASS[np.frombuffer(b"0123456789", dtype=np.uint8)] = _DIGIT
+_CLASS[np.frombuffer(b"ABCDEFGHIJKLMNOPQRSTUVWXYZ", dtype=np.uint8)] = _UPPER
+_CLASS[np.frombuffer(b"abcdefghijklmnopqrstuvwxyz", dtype=np.uint8)] = _LOWER
+#the ASCII characters str.isspace accepts
+_CLASS[np.frombuffer(b" \t\n\x0b\x0c\r\x1c\x1d\x1e\x1f", dtype=np.uint8)] = _SPACE
+
+
+def _masks_from_present(present):
+    #present: OR of the class bits of every character of each string (0 for "")
+    nonempty = present != 0
+    alpha = _UPPER | _LOWER
+    alnum = alpha | _DIGIT
+    return {
+        "isdigit": present == _DIGIT,
+        "isalpha": nonempty & ((present | alpha) == alpha),
+        "isalnum": nonempty & ((present | alnum) == alnum),
+        "isspace": present == _SPACE,
+        "isupper": (present & _UPPER != 0) & (present & _LOWER == 0),
+    }
+
+
+def _ascii_masks(codes, lengths):
+    #codes: (rows, width) uint8 character codes, lengths: real string lengths
+    present = np.empty(len(codes), dtype=np.uint8)
+    columns = np.arange(codes.shape[1])
+    for low in range(0, len(codes), CHUNK_ROWS):
+        high = low + CHUNK_ROWS
+        bits = _CLASS[codes[low:high]]
+        #padding after the end of each string does not count
+        bits[columns >= lengths[low:high, None]] = 0
+        present[low:high] = np.bitwise_or.reduce(bits, axis=1) if bits.shape[1] else 0
+    return _masks_from_present(present)
+
+
+def _to_codes(arr):
+    #(rows, width) uint8 view of a NumPy string array, None if it is not pure ASCII
+    if arr.dtype.kind == "S":
+        codes = arr.view(np.uint8).reshape(len(arr), arr.dtype.itemsize)
+    else:
+        codes = arr.view(np.uint32).reshape(len(arr), arr.dtype.itemsize // 4)
+    if codes.size and codes.max() > 127:
+        return None
+    return codes.astype(np.uint8, copy=False)
+
+
+def _numpy_masks(arr, checks):
+    codes = _to_codes(arr)
+    if codes is not None:
+        masks = _ascii_masks(codes, np.char.str_len(arr))
+        return {name: masks[name] for name in checks}
+    #non-ASCII text: the element-wise np.char functions (full Unicode rules)
+    return {name: getattr(np.char, name)(arr) for name in checks}
+
+
+def classify(values, checks=CHECKS):
+    """
+    Return {check: boolean mask} for every check in checks (any of CHECKS),
+    with the same meaning as the str methods of the same name.
+    values: a list of str, a NumPy string array ("U" or "S") or a pandas Series.
+    Pure-ASCII data goes through a byte-level path: every character is
+    looked up once in a 256-entry class table and the classes of each string
+    are OR-ed together, so all five checks come from one pass. Other data
+    uses np.char (arrays, lists) or the pandas .str methods (Series).
+    A Series gives Series masks with the same index (missing values are False),
+    everything else gives NumPy arrays. (NumPy drops trailing NUL
+    characters from its strings, so "12\x00" is checked as "12".)
+    """
+    unknown = set(checks) - set(CHECKS)
+    if unknown:
+        raise ValueError(f"unknown checks {sorted(unknown)}, choose from {CHECKS}")
+    if isinstance(values, pd.Series):
+        missing = values.isna()
+        arr = values.where(~missing, "").to_numpy(dtype=str)
+        if len(arr) == 0 or _to_codes(arr) is not None:
+            present = ~missing.to_numpy()
+            masks = _numpy_masks(arr, checks)
+            return {name: pd.Series(mask & present, index=values.index) for name, mask in masks.items()}
+        text = values.astype("str").str
+        return {name: getattr(text, name)().fillna(False).astype(bool) for name in checks}
+    arr = values if isinstance(values, np.ndarray) else np.asarray(values, dtype=str)
+    if arr.dtype.kind not in "US":
+        arr = arr.astype(str)
+    return _numpy_masks(arr.ravel(), checks)
+
+
+def _classify_loop(values, checks=CHECKS):
+    #reference approach: the str method called on each element
+    return {name: np.array([getattr(v, name)() for v in values], dtype=bool) for name in checks}
+
+
+def benchmark(n=1_000_000):
+    #per-element str methods vs np.char vs the ASCII byte path, and a pandas Series
+    rng = np.random.default_rng(0)
+    pool = ["123456", "Password1", "ABC", "abc", "   ", "", "HELLO 42", "\t\n", "9876543210", "MiXeD"]
+    values = [pool[i] for i in rng.integers(0, len(pool), n)]
+    arr = np.array(values)
+
+    start = time.perf_counter()
+    expected = _classify_loop(values)
+    t_loop = time.perf_counter() - start
+
+    start = time.perf_counter()
+    by_char = {name: getattr(np.char, name)(arr) for name in CHECKS}
+    t_char = time.perf_counter() - start
+
+    start = time.perf_counter()
+    masks = classify(arr)
+    t_ascii = time.perf_counter() - start
+
+    series = pd.Series(values)
+    start = time.perf_counter()
+    series_masks = classify(series)
+    t_series = time.perf_counter() - start
+
+    for name in CHECKS:
+        assert (masks[name] == expected[name]).all() and (by_char[name] == expected[name]).all()
+        assert (series_masks[name].to_numpy() == expected[name]).all()
+    print(f"{n} strings, 5 checks: Python loops {t_loop:.2f} s, np.char {t_char:.2f} s, "
+          f"ASCII byte path {t_ascii:.2f} s, pandas Series {t_series:.2f} s")
+
+    #non-ASCII data goes through np.char / pandas .str
+    unicode_values = values[:10_000] + ["١٢٣", "ÉTÉ", "été", " ", "Ⅻ"]
+    unicode_expected = _classify_loop(unicode_values)
+    for result in (classify(unicode_values), classify(pd.Series(unicode_values))):
+        for name in CHECKS:
+            assert (np.asarray(result[name]) == unicode_expected[name]).all(), name
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,135 @@
+#Q10 Reverse words in a sentence
+#Module : streaming word reversal (each word reversed, word order kept) for strings and large files
+
+import io
+import os
+import re
+import sys
+import time
+
+#bytes read per block
+BLOCK_SIZE = 1 << 22
+
+_WORD = re.compile(r"\S+")
+#single ASCII whitespace characters (the same set str.split uses), kept as separators by re.split
+_SPACE_BYTES = re.compile(rb"([\s\x1c-\x1f])")
+#ASCII whitespace other than " " and "\n"
+_OTHER_SPACE_BYTES = re.compile(rb"[\t\r\x0b\x0c\x1c-\x1f]")
+
+
+def _reverse_match(match):
+    return match.group()[::-1]
+
+
+def reverse_words(text):
+    """
+    Return text with every word (run of non-whitespace) reversed in place,
+    keeping the word order and all whitespace as it is: "Hello world" -> "olleH dlrow".
+    """
+    return _WORD.sub(_reverse_match, text)
+
+
+def _reverse_block(block):
+    #ASCII block: reversing the whole block in C reverses every word and also
+    #the order of words and separators; splitting that on single whitespace
+    #characters and joining the pieces back in reverse order restores the order
+    rev = block[::-1]
+    if _OTHER_SPACE_BYTES.search(block) is None:
+        #only spaces and newlines: two plain splits, no regex per word
+        lines = rev.split(b"\n")
+        lines.reverse()
+        return b"\n".join([b" ".join(line.split(b" ")[::-1]) for line in lines])
+    parts = _SPACE_BYTES.split(rev)
+    parts.reverse()
+    return b"".join(parts)
+
+
+def _last_space(block):
+    #index just after the last whitespace byte, 0 if there is none
+    return max(block.rfind(c) for c in (b" ", b"\n", b"\t", b"\r")) + 1
+
+
+def reverse_stream(src, dst, block_size=BLOCK_SIZE):
+    """
+    Reverse every word of the binary stream src and write the result to dst.
+    The input is processed in blocks; a word cut by the block end is carried
+    over to the next block, so words crossing block boundaries stay whole.
+    Each block is written with a single write call. ASCII blocks are reversed
+    as bytes without a Python loop over words, other UTF-8 blocks are decoded
+    and reversed character by character. Returns the number of bytes written.
+    """
+    carry = b""
+    written = 0
+    while True:
+        data = src.read(block_size)
+        if not data:
+            break
+        block = carry + data
+        cut = _last_space(block)
+        if cut == 0:
+            #no whitespace yet: the whole block is part of one long word
+            carry = block
+            continue
+        block, carry = block[:cut], block[cut:]
+        if block.isascii():
+            dst.write(_reverse_block(block))
+        else:
+            dst.write(reverse_words(block.decode("utf-8")).encode("utf-8"))
+        written += len(block)
+    if carry:
+        dst.write(reverse_words(carry.decode("utf-8")).encode("utf-8"))
+        written += len(carry)
+    return written
+
+
+def reverse_file(src_path, dst_path, block_size=BLOCK_SIZE):
+    """
+    Reverse the words of a text file into another file ("-" means stdin/stdout).
+    """
+    src = sys.stdin.buffer if src_path == "-" else open(src_path, "rb")
+    dst = sys.stdout.buffer if dst_path == "-" else open(dst_path, "wb")
+    try:
+        return reverse_stream(src, dst, block_size)
+    finally:
+        if src_path != "-":
+            src.close()
+        if dst_path != "-":
+            dst.close()
+        else:
+            dst.flush()
+
+
+def _reverse_lines_split(src, dst):
+    #original approach from 10-words-reverse-in-sentence.py applied per line
+    for line in src:
+        dst.write(" ".join(word[::-1] for word in line.split()) + "\n")
+
+
+def benchmark(size=50_000_000, path="word_reverse_bench.txt"):
+    #split + slice + join per line vs block streaming, in MB/s
+    words = [b"lorem", b"ipsum", b"dolor", b"sit", b"amet", b"python", b"reverse"]
+    line = b" ".join(words * 3) + b"\n"
+    with open(path, "wb") as f:
+        f.write(line * (size // len(line)))
+    mb = os.path.getsize(path) / 2**20
+    try:
+        start = time.perf_counter()
+        expected = io.StringIO()
+        with open(path, encoding="utf-8") as src:
+            _reverse_lines_split(src, expected)
+        t_split = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = io.BytesIO()
+        with open(path, "rb") as src:
+            reverse_stream(src, result)
+        t_stream = time.perf_counter() - start
+
+        assert result.getvalue().decode() == expected.getvalue()
+        print(f"{mb:.0f} MB: split per line {mb / t_split:.1f} MB/s, block stream {mb / t_stream:.1f} MB/s")
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -1,9 +1,20 @@
 # Q5. Create a generator for Fibonacci sequence
 
+#fast doubling: returns (F(n), F(n+1)) in O(log n) steps
+def fib_pair(n):
+    if n < 0:
+        raise ValueError("n must be >= 0")
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        a, b = (d, c + d) if bit == "1" else (c, d)
+    return a, b
+
 #creating Fibonacci sequence generator
-def fibonacci_gen(num):
-    a = 0 
-    b = 1
+#start lets the sequence begin at any index instead of walking from 0
+def fibonacci_gen(num, start=0):
+    a, b = fib_pair(start)
     for i in range(num):
         yield(a) #returns a and then performs below operations
         '''In case of return below operations will be ignored or cause error'''
@@ -13,4 +24,8 @@ def fibonacci_gen(num):
 
 #printing the result and calling the function generator
 for i in fibonacci_gen(5):
+    print(i)
+
+#starting directly from F(100)
+for i in fibonacci_gen(3, start=100):
     print(i)
\ No newline at end of file